@@ -13,71 +13,249 @@ Usage: python browser_helper.py
 """
 
 import os
-import sys
+import functools
+import shutil
 import webbrowser
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from rich.table import Table
 from rich.text import Text
 import tempfile
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, unquote
-import mimetypes
 
-# Import the main transcriber
-from video_transcriber import VideoTranscriber
+from transcribe_ui import (
+    console,
+    show_browser_welcome,
+    get_local_file,
+    parse_language_codes,
+    UNIVERSAL_SOURCE_TABLE,
+    USER_AGENTS,
+    USER_AGENT_OPTIONS,
+    USER_AGENT_TABLE,
+)
 
-console = Console()
+# Streaming chunk size for direct downloads (1 MiB keeps per-chunk overhead negligible)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Shared HTTP clients, created on first use so startup does not pay for importing them
+_HTTP_HEADERS = {}
+_SESSION = None
+_HTTP2_CLIENT = None
+_HTTP2_CHECKED = False
+
+def _get_session():
+    """Get the shared requests session (HEAD + GET and retries reuse one keep-alive connection)."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(_HTTP_HEADERS)
+        _SESSION = session
+    return _SESSION
+
+def _get_http2_client():
+    """Get the optional HTTP/2 client so parallel range requests share one multiplexed connection."""
+    global _HTTP2_CLIENT, _HTTP2_CHECKED
+    if not _HTTP2_CHECKED:
+        _HTTP2_CHECKED = True
+        try:
+            import httpx
+            _HTTP2_CLIENT = httpx.Client(http2=True, timeout=30.0, follow_redirects=True, headers=_HTTP_HEADERS)
+        except ImportError:
+            # httpx or its h2 extra is not installed - range requests use the requests session
+            _HTTP2_CLIENT = None
+    return _HTTP2_CLIENT
+
+# Temporary files created by direct downloads, removed when main() exits
+_DOWNLOADED_FILES = []
+
+def _set_user_agent(user_agent):
+    """Use user_agent for all direct download requests."""
+    _HTTP_HEADERS['User-Agent'] = user_agent
+    for client in (_SESSION, _HTTP2_CLIENT):
+        if client is not None:
+            client.headers['User-Agent'] = user_agent
+
+# Files larger than this are fetched as parallel byte ranges when the server supports it
+RANGE_DOWNLOAD_THRESHOLD = 32 * 1024 * 1024
+RANGE_DOWNLOAD_WORKERS = 4
+
+# Known media extensions
+VIDEO_FORMATS = frozenset({
+    '.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv', '.m4v', 
+    '.3gp', '.ogv', '.ts', '.mts', '.m2ts', '.vob', '.asf', '.rm', 
+    '.rmvb', '.divx', '.xvid', '.f4v', '.mpg', '.mpeg', '.m2v'
+})
+
+AUDIO_FORMATS = frozenset({
+    '.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac', '.wma', '.opus',
+    '.aiff', '.au', '.ra', '.amr', '.ac3', '.dts', '.ape', '.mka'
+})
+
+# Streaming/playlist formats
+STREAMING_FORMATS = frozenset({'.m3u8', '.mpd', '.ism', '.f4m'})
+
+PLATFORM_TOKENS = ('youtube', 'vimeo', 'dailymotion', 'twitch')
+
+# File extension for media content types that reach direct downloads
+_MIME_TO_EXT = {
+    'video/mp4': '.mp4',
+    'video/webm': '.webm',
+    'video/ogg': '.ogv',
+    'video/quicktime': '.mov',
+    'video/x-matroska': '.mkv',
+    'video/x-msvideo': '.avi',
+    'video/x-flv': '.flv',
+    'video/x-ms-wmv': '.wmv',
+    'video/mpeg': '.mpg',
+    'video/3gpp': '.3gp',
+    'video/mp2t': '.ts',
+    'audio/mpeg': '.mp3',
+    'audio/mp4': '.m4a',
+    'audio/x-m4a': '.m4a',
+    'audio/aac': '.aac',
+    'audio/ogg': '.ogg',
+    'audio/opus': '.opus',
+    'audio/webm': '.webm',
+    'audio/wav': '.wav',
+    'audio/x-wav': '.wav',
+    'audio/flac': '.flac',
+    'audio/x-flac': '.flac',
+    'audio/x-ms-wma': '.wma',
+}
+
+URL_PREFIXES = ('http://', 'https://', 'ftp://')
+
+def _path_extension(path):
+    """Get the lowercase extension of the last path component ('' if none)."""
+    name = path.replace('\\', '/').rstrip('/').rpartition('/')[2]
+    stem, dot, ext = name.rpartition('.')
+    return f".{ext.lower()}" if stem and ext else ''
+
+def _source_extension(url_or_path, is_local):
+    """Get the lowercase file extension of a local path or URL."""
+    if is_local:
+        return _path_extension(url_or_path)
+    
+    # Try to get extension from URL
+    parsed = urlparse(url_or_path)
+    return _path_extension(unquote(parsed.path))
 
 def detect_video_format(url_or_path):
     """Detect if the URL/path is a video, audio, or streaming format."""
-    # Video formats
-    video_formats = {
-        '.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv', '.m4v', 
-        '.3gp', '.ogv', '.ts', '.mts', '.m2ts', '.vob', '.asf', '.rm', 
-        '.rmvb', '.divx', '.xvid', '.f4v', '.mpg', '.mpeg', '.m2v'
-    }
-    
-    # Audio formats
-    audio_formats = {
-        '.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac', '.wma', '.opus',
-        '.aiff', '.au', '.ra', '.amr', '.ac3', '.dts', '.ape', '.mka'
-    }
-    
-    # Streaming/playlist formats
-    streaming_formats = {'.m3u8', '.mpd', '.ism', '.f4m'}
-    
-    # Get file extension
-    if os.path.exists(url_or_path):
-        ext = Path(url_or_path).suffix.lower()
-    else:
-        # Try to get extension from URL
-        parsed = urlparse(url_or_path)
-        path = unquote(parsed.path)
-        ext = Path(path).suffix.lower()
+    # The filesystem check stays out of the cache, as files come and go between calls;
+    # URLs never need it
+    is_local = not url_or_path.startswith(URL_PREFIXES) and os.path.exists(url_or_path)
+    return _classify_source(url_or_path, is_local)
+
+@functools.lru_cache(maxsize=256)
+def _classify_source(url_or_path, is_local):
+    """Classify a URL/path by its extension or platform name (pure, so cached)."""
+    ext = _source_extension(url_or_path, is_local)
     
-    if ext in video_formats:
+    if ext in VIDEO_FORMATS:
         return 'video'
-    elif ext in audio_formats:
+    elif ext in AUDIO_FORMATS:
         return 'audio'
-    elif ext in streaming_formats:
+    elif ext in STREAMING_FORMATS:
         return 'streaming'
-    elif any(platform in url_or_path.lower() for platform in ['youtube', 'vimeo', 'dailymotion', 'twitch']):
+    elif any(platform in url_or_path.lower() for platform in PLATFORM_TOKENS):
         return 'platform'
     else:
         return 'unknown'
 
+def _preallocate(f, size):
+    """Reserve size bytes for an open file before writing.
+
+    This avoids growing the file chunk by chunk, and gives the parallel range
+    workers a full-size file to write into at their own offsets.
+    """
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except (AttributeError, OSError):
+        # posix_fallocate is unavailable (e.g. Windows) or unsupported by the filesystem
+        f.truncate(size)
+
+def _stream_to_file(response, f):
+    """Copy a streamed response body into an open binary file."""
+    if response.headers.get('transfer-encoding', '').lower() == 'chunked':
+        # Chunked bodies go through requests' own chunk iterator
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+    else:
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+
+def _check_partial_response(response):
+    """Ensure a range request was answered with 206 Partial Content."""
+    response.raise_for_status()
+    if response.status_code != 206:
+        raise RuntimeError(f"Server ignored range request (HTTP {response.status_code})")
+
+def _download_range(url, file_path, start, end):
+    """Download bytes start..end (inclusive) of url into the same offset of file_path."""
+    headers = {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+
+    http2_client = _get_http2_client()
+    if http2_client is not None:
+        with http2_client.stream('GET', url, headers=headers) as response:
+            _check_partial_response(response)
+            with open(file_path, 'r+b') as f:
+                f.seek(start)
+                for chunk in response.iter_raw(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                written = f.tell() - start
+    else:
+        response = _get_session().get(url, headers=headers, stream=True, timeout=30)
+        _check_partial_response(response)
+        with open(file_path, 'r+b') as f:
+            f.seek(start)
+            _stream_to_file(response, f)
+            written = f.tell() - start
+
+    if written != end - start + 1:
+        raise RuntimeError(f"Incomplete range {start}-{end}: got {written} bytes")
+
+def _download_parallel(url, file_path, size):
+    """Download url as concurrent byte ranges into a preallocated file. Returns True on success."""
+    step = -(-size // RANGE_DOWNLOAD_WORKERS)
+    ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+    try:
+        # Create the shared clients before the workers race to do it
+        _get_session()
+        _get_http2_client()
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(_download_range, url, file_path, start, end) for start, end in ranges]
+            for future in futures:
+                future.result()
+        return True
+    except Exception as e:
+        console.print(f"[yellow]Parallel download failed ({str(e)}), retrying as a single stream[/yellow]")
+        return False
+
 def download_direct_video(url):
     """Download video directly from URL."""
     try:
         console.print(f"[yellow]Attempting direct download from: {url}[/yellow]")
         
         # Get file info
-        response = requests.head(url, allow_redirects=True, timeout=10)
+        response = _get_session().head(url, allow_redirects=True, timeout=10)
         content_type = response.headers.get('content-type', '')
         content_length = response.headers.get('content-length')
+        accept_ranges = response.headers.get('accept-ranges', '')
         
         if content_length:
             size_mb = int(content_length) / (1024 * 1024)
@@ -88,22 +266,30 @@ def download_direct_video(url):
             console.print(f"[green]✓ Detected media file: {content_type}[/green]")
             
             # Download the file
-            temp_dir = tempfile.mkdtemp()
-            filename = Path(urlparse(url).path).name or "media_file"
-            if not Path(filename).suffix:
+            ext = Path(urlparse(url).path).suffix
+            if not ext:
                 # Guess extension from content type
-                ext = mimetypes.guess_extension(content_type) or '.mp4'
-                filename += ext
+                ext = _MIME_TO_EXT.get(content_type.split(';', 1)[0].strip().lower(), '.mp4')
             
-            file_path = os.path.join(temp_dir, filename)
+            fd, file_path = tempfile.mkstemp(suffix=ext, prefix='media_')
+            _DOWNLOADED_FILES.append(file_path)
             
             console.print("[yellow]Downloading file...[/yellow]")
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
+            size = int(content_length) if content_length else 0
+            use_ranges = accept_ranges.lower() == 'bytes' and size > RANGE_DOWNLOAD_THRESHOLD
             
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with os.fdopen(fd, 'wb') as f:
+                if size:
+                    _preallocate(f, size)
+                
+                if not (use_ranges and _download_parallel(url, file_path, size)):
+                    response = _get_session().get(url, stream=True, timeout=30)
+                    response.raise_for_status()
+                    
+                    f.seek(0)
+                    _stream_to_file(response, f)
+                    # Drop any unused reservation (e.g. a decoded body shorter than Content-Length)
+                    f.truncate()
             
             console.print(f"[green]✓ Downloaded to: {file_path}[/green]")
             return file_path
@@ -115,43 +301,10 @@ def download_direct_video(url):
         console.print(f"[red]Direct download failed: {str(e)}[/red]")
         return None
 
-def show_browser_welcome():
-    """Display browser-specific welcome message."""
-    console.print(Panel.fit(
-        "[bold blue]🌐 Browser-Compatible Video Transcriber[/bold blue]\n\n"
-        "[yellow]This tool works with ANY video format:[/yellow]\n"
-        "• Direct video file URLs (.mp4, .avi, .mov, .webm, etc.)\n"
-        "• Streaming URLs (.m3u8, .mpd, etc.)\n"
-        "• Platform videos (YouTube, Vimeo, etc.)\n"
-        "• Local files (drag & drop or browse)\n"
-        "• Audio files (.mp3, .wav, .m4a, etc.)\n\n"
-        "[green]Browser Features:[/green]\n"
-        "• Cookie support for authenticated content\n"
-        "• Multiple user agents (Chrome, Firefox, Safari, Mobile)\n"
-        "• Direct download for simple video URLs\n"
-        "• Universal format support\n\n"
-        "[cyan]Works like a browser - handles any video source![/cyan]",
-        title="Universal Video Support",
-        border_style="blue"
-    ))
-
 def get_universal_video_source():
     """Get video source with universal format support."""
     console.print("\n[bold cyan]Choose your video source:[/bold cyan]")
-    
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Option", style="cyan", width=8)
-    table.add_column("Description", style="white")
-    table.add_column("Example", style="yellow")
-    
-    table.add_row("1", "Direct Video URL", "https://example.com/video.mp4")
-    table.add_row("2", "YouTube/Platform Video", "https://www.youtube.com/watch?v=VIDEO_ID")
-    table.add_row("3", "Streaming URL", "https://example.com/stream.m3u8")
-    table.add_row("4", "Local Video File", "C:/path/to/video.mp4")
-    table.add_row("5", "Local Audio File", "C:/path/to/audio.mp3")
-    table.add_row("6", "Browse for File", "Interactive file browser")
-    
-    console.print(table)
+    console.print(UNIVERSAL_SOURCE_TABLE)
     
     choice = Prompt.ask("\nSelect option", choices=["1", "2", "3", "4", "5", "6"], default="1")
     
@@ -176,38 +329,14 @@ def get_universal_video_source():
         url = Prompt.ask("\n[cyan]Enter streaming URL (.m3u8, .mpd, etc.)[/cyan]")
         return url
         
-    elif choice == "4":
-        return get_local_file("video")
-        
-    elif choice == "5":
-        return get_local_file("audio")
+    elif choice in ("4", "5"):
+        file_path = get_local_file("video" if choice == "4" else "audio")
+        console.print(f"[green]✓ File found - Format: {detect_video_format(file_path)}[/green]")
+        return file_path
         
     else:  # choice == "6"
         return browse_for_file()
 
-def get_local_file(file_type):
-    """Get local file path from user."""
-    console.print(f"\n[cyan]Enter path to your local {file_type} file:[/cyan]")
-    
-    if file_type == "video":
-        extensions = "(.mp4, .avi, .mov, .mkv, .webm, .flv, .wmv, .m4v, etc.)"
-    else:
-        extensions = "(.mp3, .wav, .m4a, .aac, .ogg, .flac, .wma, .opus, etc.)"
-    
-    console.print(f"[yellow]Supported formats: {extensions}[/yellow]")
-    
-    while True:
-        file_path = Prompt.ask("File path")
-        
-        if os.path.exists(file_path):
-            format_type = detect_video_format(file_path)
-            console.print(f"[green]✓ File found - Format: {format_type}[/green]")
-            return file_path
-        else:
-            console.print(f"[red]File not found: {file_path}[/red]")
-            if not Confirm.ask("Try again?", default=True):
-                sys.exit(1)
-
 def browse_for_file():
     """Simulate file browser (in real implementation, this could use tkinter)."""
     console.print("\n[yellow]File Browser Simulation[/yellow]")
@@ -231,33 +360,14 @@ def get_browser_options():
     
     if use_custom_ua:
         console.print("\n[yellow]User-Agent Options:[/yellow]")
-        ua_table = Table(show_header=True, header_style="bold magenta")
-        ua_table.add_column("Option", style="cyan", width=8)
-        ua_table.add_column("Browser", style="white")
+        console.print(USER_AGENT_TABLE)
         
-        ua_table.add_row("1", "Chrome (Windows)")
-        ua_table.add_row("2", "Firefox (Windows)")
-        ua_table.add_row("3", "Safari (macOS)")
-        ua_table.add_row("4", "Mobile Safari (iOS)")
-        ua_table.add_row("5", "Chrome Mobile (Android)")
-        ua_table.add_row("6", "Custom")
-        
-        console.print(ua_table)
-        
-        ua_choice = Prompt.ask("Select User-Agent", choices=["1", "2", "3", "4", "5", "6"], default="1")
-        
-        user_agents = {
-            "1": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "2": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
-            "3": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
-            "4": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1",
-            "5": "Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
-        }
+        ua_choice = Prompt.ask("Select User-Agent", choices=USER_AGENT_OPTIONS, default="1")
         
         if ua_choice == "6":
             user_agent = Prompt.ask("Enter custom User-Agent")
         else:
-            user_agent = user_agents[ua_choice]
+            user_agent = USER_AGENTS[ua_choice]
     
     # Cookie support
     use_cookies = Confirm.ask("Enable cookie support?", default=False)
@@ -272,7 +382,7 @@ def get_browser_options():
     if Confirm.ask("Specify languages?", default=False):
         console.print("[yellow]Enter language codes separated by commas (e.g., en,es,fr,de)[/yellow]")
         lang_input = Prompt.ask("Language codes", default="en")
-        target_languages = [lang.strip() for lang in lang_input.split(",")]
+        target_languages = parse_language_codes(lang_input)
         
         if force_whisper or Confirm.ask("Specify Whisper language?", default=False):
             whisper_language = Prompt.ask("Whisper language (or Enter for auto-detect)", default="")
@@ -289,17 +399,21 @@ def get_browser_options():
 def main():
     """Main function for browser-compatible video processing."""
     show_browser_welcome()
+    transcriber = None
     
     try:
+        # Get browser options first: a direct download starts while the source is chosen,
+        # so the User-Agent must already be on the session by then
+        options = get_browser_options()
+        if options['user_agent']:
+            _set_user_agent(options['user_agent'])
+        
         # Get video source
         url = get_universal_video_source()
         if not url:
             console.print("[red]No valid video source provided[/red]")
             return
         
-        # Get browser options
-        options = get_browser_options()
-        
         # Show processing info
         console.print(f"\n[green]Processing:[/green] {url}")
         console.print(f"[green]Format:[/green] {detect_video_format(url)}")
@@ -311,7 +425,8 @@ def main():
             console.print("[yellow]Cancelled by user[/yellow]")
             return
         
-        # Initialize transcriber
+        # Initialize transcriber (imported here so the prompts above start instantly)
+        from video_transcriber import VideoTranscriber
         transcriber = VideoTranscriber()
         
         # Apply browser options (this would require modifying the transcriber)
@@ -359,9 +474,13 @@ def main():
         console.print("\n[yellow]Try using a direct video file URL or local file[/yellow]")
     finally:
         # Cleanup
-        import shutil
-        if hasattr(transcriber, 'temp_dir') and os.path.exists(transcriber.temp_dir):
-            shutil.rmtree(transcriber.temp_dir)
+        if transcriber is not None:
+            transcriber.cleanup()
+        while _DOWNLOADED_FILES:
+            try:
+                os.remove(_DOWNLOADED_FILES.pop())
+            except OSError:
+                pass
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
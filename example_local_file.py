@@ -6,13 +6,13 @@ This example shows how to use the video transcriber when online downloads fail.
 Simply update the file paths below to point to your local video or audio files.
 """
 
-from video_transcriber import VideoTranscriber
 from rich.console import Console
 
 console = Console()
 
 def main():
-    # Initialize the transcriber
+    # Initialize the transcriber (imported here to keep script startup fast)
+    from video_transcriber import VideoTranscriber
     transcriber = VideoTranscriber()
     
     # Example 1: Local video file
@@ -59,9 +59,7 @@ def main():
     
     finally:
         # Cleanup
-        import shutil
-        if hasattr(transcriber, 'temp_dir') and os.path.exists(transcriber.temp_dir):
-            shutil.rmtree(transcriber.temp_dir)
+        transcriber.cleanup()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -10,49 +10,15 @@ This script provides an easy way to run the video transcriber with different sou
 Usage: python run_transcriber.py
 """
 
-import os
-import sys
-from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from rich.table import Table
 
-# Import the main transcriber
-from video_transcriber import VideoTranscriber
-
-console = Console()
-
-def show_welcome():
-    """Display welcome message and options."""
-    console.print(Panel.fit(
-        "[bold blue]🎥 Video Transcription Validator[/bold blue]\n\n"
-        "[yellow]This tool analyzes video transcriptions by:[/yellow]\n"
-        "• Extracting captions from videos\n"
-        "• Transcribing audio with AI (Whisper)\n"
-        "• Comparing accuracy and timing\n"
-        "• Generating detailed reports\n\n"
-        "[green]Supports:[/green] YouTube, Dell, Vimeo, local files",
-        title="Welcome",
-        border_style="blue"
-    ))
+from transcribe_ui import console, show_welcome, get_local_file, parse_language_codes, SOURCE_TABLE
 
 def get_video_source():
     """Get video source from user."""
     console.print("\n[bold cyan]Choose your video source:[/bold cyan]")
-    
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Option", style="cyan", width=8)
-    table.add_column("Description", style="white")
-    table.add_column("Example", style="yellow")
-    
-    table.add_row("1", "YouTube Video", "https://www.youtube.com/watch?v=VIDEO_ID")
-    table.add_row("2", "Dell Support Video", "https://www.dell.com/support/...")
-    table.add_row("3", "Other Online Video", "https://vimeo.com/VIDEO_ID")
-    table.add_row("4", "Local Video File", "C:/path/to/video.mp4")
-    table.add_row("5", "Local Audio File", "C:/path/to/audio.mp3")
-    
-    console.print(table)
+    console.print(SOURCE_TABLE)
     
     choice = Prompt.ask("\nSelect option", choices=["1", "2", "3", "4", "5"], default="1")
     
@@ -69,27 +35,6 @@ def get_video_source():
     
     return url
 
-def get_local_file(file_type):
-    """Get local file path from user."""
-    console.print(f"\n[cyan]Enter path to your local {file_type} file:[/cyan]")
-    
-    if file_type == "video":
-        extensions = "(.mp4, .avi, .mov, .mkv, .webm, etc.)"
-    else:
-        extensions = "(.mp3, .wav, .m4a, .aac, .ogg, .flac, etc.)"
-    
-    console.print(f"[yellow]Supported formats: {extensions}[/yellow]")
-    
-    while True:
-        file_path = Prompt.ask("File path")
-        
-        if os.path.exists(file_path):
-            return file_path
-        else:
-            console.print(f"[red]File not found: {file_path}[/red]")
-            if not Confirm.ask("Try again?", default=True):
-                sys.exit(1)
-
 def get_processing_options():
     """Get processing options from user."""
     console.print("\n[bold cyan]Processing Options:[/bold cyan]")
@@ -113,7 +58,7 @@ def get_processing_options():
         console.print("[yellow]Enter language codes separated by commas (e.g., en,es,fr,de)[/yellow]")
         console.print("[yellow]Common codes: en(English), es(Spanish), fr(French), de(German), it(Italian), pt(Portuguese), ru(Russian), ja(Japanese), ko(Korean), zh(Chinese), ar(Arabic), hi(Hindi)[/yellow]")
         lang_input = Prompt.ask("Language codes", default="en,es,fr,de")
-        target_languages = [lang.strip() for lang in lang_input.split(",")]
+        target_languages = parse_language_codes(lang_input)
     
     # Whisper language
     whisper_language = None
@@ -129,6 +74,7 @@ def get_processing_options():
 def main():
     """Main function."""
     show_welcome()
+    transcriber = None
     
     try:
         # Get video source
@@ -151,7 +97,8 @@ def main():
             console.print("[yellow]Cancelled by user[/yellow]")
             return
         
-        # Initialize transcriber and process
+        # Initialize transcriber and process (imported here so the prompts above start instantly)
+        from video_transcriber import VideoTranscriber
         transcriber = VideoTranscriber()
         
         console.print("\n" + "="*60)
@@ -194,9 +141,8 @@ def main():
         console.print("\n[yellow]Try using a local file if online download failed[/yellow]")
     finally:
         # Cleanup
-        import shutil
-        if hasattr(transcriber, 'temp_dir') and os.path.exists(transcriber.temp_dir):
-            shutil.rmtree(transcriber.temp_dir)
+        if transcriber is not None:
+            transcriber.cleanup()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
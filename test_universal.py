@@ -1 +1,78 @@
- 
\ No newline at end of file
+import os
+import unittest
+from unittest import mock
+
+import requests
+
+import browser_helper
+
+CHOSEN_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0"
+
+
+class FakeSession:
+    """Stands in for the shared requests session and records the headers each HEAD request carries."""
+
+    def __init__(self):
+        self.headers = {}
+        self.head_headers = []
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def head(self, url, **kwargs):
+        self.head_headers.append(dict(self.headers, **kwargs.get("headers", {})))
+        response = mock.Mock()
+        response.headers = {"content-type": "text/html"}  # not media, so nothing is downloaded
+        return response
+
+
+class DirectDownloadUserAgentTest(unittest.TestCase):
+    def setUp(self):
+        # Shared HTTP clients start out unset and without a User-Agent, as in a fresh process
+        for patcher in (
+            mock.patch.object(browser_helper, "_SESSION", None),
+            mock.patch.object(browser_helper, "_HTTP2_CLIENT", None),
+            mock.patch.object(browser_helper, "_HTTP2_CHECKED", True),
+            mock.patch.dict(browser_helper._HTTP_HEADERS, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def run_main(self, session):
+        """Run main() choosing a direct video URL, with the transcriber mocked out."""
+        options = {
+            "user_agent": CHOSEN_USER_AGENT,
+            "use_cookies": False,
+            "force_whisper": False,
+            "target_languages": None,
+            "whisper_language": None,
+        }
+        transcriber = mock.Mock(temp_dir=os.path.join(os.devnull, "missing"))
+        transcriber.process_video.return_value = []
+        prompts = iter(["1", "https://example.com/video.mp4"])  # source option, URL
+        confirms = iter([True, True])  # try direct download, proceed with transcription
+        with mock.patch.object(requests, "Session", return_value=session), \
+                mock.patch("video_transcriber.VideoTranscriber", return_value=transcriber), \
+                mock.patch.object(browser_helper, "get_browser_options", return_value=options), \
+                mock.patch.object(browser_helper.Prompt, "ask", side_effect=lambda *a, **k: next(prompts)), \
+                mock.patch.object(browser_helper.Confirm, "ask", side_effect=lambda *a, **k: next(confirms)), \
+                mock.patch.object(browser_helper, "show_browser_welcome"), \
+                mock.patch.object(browser_helper, "console"):
+            browser_helper.main()
+
+    def test_direct_download_head_uses_chosen_user_agent(self):
+        session = FakeSession()
+        self.run_main(session)
+        self.assertEqual(len(session.head_headers), 1)
+        self.assertEqual(session.head_headers[0].get("User-Agent"), CHOSEN_USER_AGENT)
+
+    def test_user_agent_reaches_existing_session(self):
+        session = FakeSession()
+        with mock.patch.object(requests, "Session", return_value=session):
+            browser_helper._get_session()  # session created before the User-Agent is chosen
+        self.run_main(session)
+        self.assertEqual(session.head_headers[0].get("User-Agent"), CHOSEN_USER_AGENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
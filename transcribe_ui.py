@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Shared Console UI for the Video Transcriber Scripts
+
+Helpers used by both run_transcriber.py and browser_helper.py:
+- Welcome panels
+- Video source option tables
+- Local file prompt
+- Browser User-Agent strings
+- Language code parsing
+
+Panels and tables are built once at import time and re-rendered on demand.
+"""
+
+import os
+import sys
+import functools
+from rich.console import Console
+from rich.panel import Panel
+from rich.prompt import Prompt, Confirm
+from rich.table import Table
+
+console = Console()
+
+WELCOME_PANEL = Panel.fit(
+    "[bold blue]🎥 Video Transcription Validator[/bold blue]\n\n"
+    "[yellow]This tool analyzes video transcriptions by:[/yellow]\n"
+    "• Extracting captions from videos\n"
+    "• Transcribing audio with AI (Whisper)\n"
+    "• Comparing accuracy and timing\n"
+    "• Generating detailed reports\n\n"
+    "[green]Supports:[/green] YouTube, Dell, Vimeo, local files",
+    title="Welcome",
+    border_style="blue"
+)
+
+BROWSER_WELCOME_PANEL = Panel.fit(
+    "[bold blue]🌐 Browser-Compatible Video Transcriber[/bold blue]\n\n"
+    "[yellow]This tool works with ANY video format:[/yellow]\n"
+    "• Direct video file URLs (.mp4, .avi, .mov, .webm, etc.)\n"
+    "• Streaming URLs (.m3u8, .mpd, etc.)\n"
+    "• Platform videos (YouTube, Vimeo, etc.)\n"
+    "• Local files (drag & drop or browse)\n"
+    "• Audio files (.mp3, .wav, .m4a, etc.)\n\n"
+    "[green]Browser Features:[/green]\n"
+    "• Cookie support for authenticated content\n"
+    "• Multiple user agents (Chrome, Firefox, Safari, Mobile)\n"
+    "• Direct download for simple video URLs\n"
+    "• Universal format support\n\n"
+    "[cyan]Works like a browser - handles any video source![/cyan]",
+    title="Universal Video Support",
+    border_style="blue"
+)
+
+def _source_table(rows):
+    """Build a video source option table from (option, description, example) rows."""
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Option", style="cyan", width=8)
+    table.add_column("Description", style="white")
+    table.add_column("Example", style="yellow")
+
+    for row in rows:
+        table.add_row(*row)
+
+    return table
+
+SOURCE_TABLE = _source_table([
+    ("1", "YouTube Video", "https://www.youtube.com/watch?v=VIDEO_ID"),
+    ("2", "Dell Support Video", "https://www.dell.com/support/..."),
+    ("3", "Other Online Video", "https://vimeo.com/VIDEO_ID"),
+    ("4", "Local Video File", "C:/path/to/video.mp4"),
+    ("5", "Local Audio File", "C:/path/to/audio.mp3"),
+])
+
+UNIVERSAL_SOURCE_TABLE = _source_table([
+    ("1", "Direct Video URL", "https://example.com/video.mp4"),
+    ("2", "YouTube/Platform Video", "https://www.youtube.com/watch?v=VIDEO_ID"),
+    ("3", "Streaming URL", "https://example.com/stream.m3u8"),
+    ("4", "Local Video File", "C:/path/to/video.mp4"),
+    ("5", "Local Audio File", "C:/path/to/audio.mp3"),
+    ("6", "Browse for File", "Interactive file browser"),
+])
+
+# (option, browser, User-Agent string) rows; option "6" is a user-supplied string
+USER_AGENT_CHOICES = (
+    ("1", "Chrome (Windows)", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
+    ("2", "Firefox (Windows)", "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0"),
+    ("3", "Safari (macOS)", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15"),
+    ("4", "Mobile Safari (iOS)", "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"),
+    ("5", "Chrome Mobile (Android)", "Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"),
+)
+
+USER_AGENTS = {option: user_agent for option, _, user_agent in USER_AGENT_CHOICES}
+
+USER_AGENT_OPTIONS = [option for option, _, _ in USER_AGENT_CHOICES] + ["6"]
+
+USER_AGENT_TABLE = Table(show_header=True, header_style="bold magenta")
+USER_AGENT_TABLE.add_column("Option", style="cyan", width=8)
+USER_AGENT_TABLE.add_column("Browser", style="white")
+for _option, _browser, _ in USER_AGENT_CHOICES:
+    USER_AGENT_TABLE.add_row(_option, _browser)
+USER_AGENT_TABLE.add_row("6", "Custom")
+
+@functools.lru_cache(maxsize=32)
+def _split_language_codes(lang_input):
+    return tuple(lang.strip() for lang in lang_input.split(","))
+
+def parse_language_codes(lang_input):
+    """Parse comma-separated language codes (e.g. "en, es,fr") into a list."""
+    return list(_split_language_codes(lang_input))
+
+def show_welcome():
+    """Display welcome message and options."""
+    console.print(WELCOME_PANEL)
+
+def show_browser_welcome():
+    """Display browser-specific welcome message."""
+    console.print(BROWSER_WELCOME_PANEL)
+
+def get_local_file(file_type):
+    """Get local file path from user."""
+    console.print(f"\n[cyan]Enter path to your local {file_type} file:[/cyan]")
+
+    if file_type == "video":
+        extensions = "(.mp4, .avi, .mov, .mkv, .webm, .flv, .wmv, .m4v, etc.)"
+    else:
+        extensions = "(.mp3, .wav, .m4a, .aac, .ogg, .flac, .wma, .opus, etc.)"
+
+    console.print(f"[yellow]Supported formats: {extensions}[/yellow]")
+
+    while True:
+        file_path = Prompt.ask("File path")
+
+        if os.path.exists(file_path):
+            return file_path
+        else:
+            console.print(f"[red]File not found: {file_path}[/red]")
+            if not Confirm.ask("Try again?", default=True):
+                sys.exit(1)
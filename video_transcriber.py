@@ -1,6 +1,16 @@
 import os
+import io
+import sys
+import heapq
+import gzip
+import stat
 import json
-from faster_whisper import WhisperModel
+import time
+import hashlib
+import functools
+import bisect
+# faster_whisper (with ctranslate2) and pandas are imported where they are used:
+# together they take about half a second to import
 import yt_dlp
 from rich.console import Console
 from rich.progress import (
@@ -13,170 +23,305 @@ from rich.progress import (
     TransferSpeedColumn,
 )
 from rich.table import Table
-from pydub import AudioSegment
+from rich.text import Text
+from rich.style import Style
 import tempfile
+from pathlib import Path
 import re
-from typing import List, Dict, Tuple, Optional
-from difflib import SequenceMatcher
-import jiwer
+from typing import List, Dict, Tuple, Optional, NamedTuple, TYPE_CHECKING
+from rapidfuzz.distance import Levenshtein
 import webvtt
 from rich.panel import Panel
 from rich import box
 from rich.align import Align
-import re
-import webvtt
-import tempfile
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # results are written with the standard json module instead
 
 console = Console()
 
 CHUNK_SIZE = 30  # seconds (longer chunk for better alignment)
+SEARCH_TOLERANCE = 30.0  # seconds around a caption searched by the sliding-window match
+VTT_FETCH_WORKERS = 8  # concurrent caption/VTT fragment downloads
+HTTP_TIMEOUT = 10  # seconds to wait on a caption server before giving up
+WHISPER_BATCH_SIZE = 16  # audio chunks decoded together by the batched Whisper pipeline
+VAD_MIN_SILENCE_MS = 500  # silences this long are cut out before transcription
+TABLE_MAX_ROWS = 50  # lowest-accuracy captions printed unless the full table is requested
+INFO_CACHE_DIR = os.path.join(  # yt-dlp info dicts kept between runs, per user
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "video_transcriber", "info",
+)
+INFO_CACHE_TTL = 3600  # seconds; the signed media URLs inside an info dict expire after a few hours
+WHISPER_SKIP_COVERAGE = 0.95  # share of a video manual captions must span for skip_whisper_if_covered
+
+_SESSION = None
+
+
+def _get_session():
+    """Get the shared requests session used for caption downloads (keep-alive + retries)."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,  # caption tracks and fragments can come from several CDN hosts
+            pool_maxsize=VTT_FETCH_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def _fetch_all(urls):
+    """Download the text of each URL concurrently, keeping order; failed downloads yield the exception."""
+    def fetch(url):
+        try:
+            return _get_session().get(url, timeout=HTTP_TIMEOUT).text
+        except Exception as e:
+            return e
+
+    if len(urls) <= 1:
+        return [fetch(url) for url in urls]
+    with ThreadPoolExecutor(max_workers=min(VTT_FETCH_WORKERS, len(urls))) as pool:
+        return list(pool.map(fetch, urls))
+
+
+def _saved_info_path(url: str) -> str:
+    """File holding the saved yt-dlp info dict for url."""
+    return os.path.join(INFO_CACHE_DIR, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _info_cache_is_private() -> bool:
+    """Whether INFO_CACHE_DIR is a real directory only the current user can reach."""
+    try:
+        st = os.lstat(INFO_CACHE_DIR)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if hasattr(os, "getuid"):  # POSIX only; Windows profiles are already per user
+        return st.st_uid == os.getuid() and not st.st_mode & 0o077
+    return True
+
+
+def _load_saved_info(url: str) -> Optional[dict]:
+    """yt-dlp info dict saved for url by an earlier run, if it is younger than INFO_CACHE_TTL."""
+    if not _info_cache_is_private():
+        return None
+    path = _saved_info_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > INFO_CACHE_TTL:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_info(url: str, info: dict):
+    """Save a yt-dlp info dict so later runs on the same URL skip extraction (best effort)."""
+    try:
+        os.makedirs(INFO_CACHE_DIR, mode=0o700, exist_ok=True)
+        if not _info_cache_is_private():
+            return
+        # Write to a unique temp file then rename, so concurrent runs never see a half-written file
+        fd, tmp_path = tempfile.mkstemp(dir=INFO_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(yt_dlp.YoutubeDL.sanitize_info(info), f)
+            os.replace(tmp_path, _saved_info_path(url))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _forget_saved_info(url: str):
+    """Drop a saved info dict, e.g. after its media URLs stopped working."""
+    try:
+        os.remove(_saved_info_path(url))
+    except OSError:
+        pass
+
+
+class WordErrors(NamedTuple):
+    """Word-level alignment counts between a reference and a hypothesis."""
+    hits: int
+    substitutions: int
+    deletions: int
+    insertions: int
+
+
+def word_errors(reference_ids, hypothesis_ids) -> WordErrors:
+    """Count hits/substitutions/deletions/insertions between two token ID sequences."""
+    # Identical sequences (the common case for clean captions) need no alignment
+    if reference_ids == hypothesis_ids:
+        return WordErrors(len(reference_ids), 0, 0, 0)
+    hits = substitutions = deletions = insertions = 0
+    for tag, i1, i2, j1, j2 in Levenshtein.opcodes(reference_ids, hypothesis_ids):
+        if tag == "equal":
+            hits += i2 - i1
+        elif tag == "replace":
+            substitutions += i2 - i1
+        elif tag == "delete":
+            deletions += i2 - i1
+        else:
+            insertions += j2 - j1
+    return WordErrors(hits, substitutions, deletions, insertions)
+
+
+# Special characters and symbols normalized by clean_text, applied in order
+# (so "…" becomes " dot  dot  dot " and "–" becomes " dash ")
+CLEAN_REPLACEMENTS = {
+    "&": "and",  # Replace ampersand
+    "Â": "",  # Remove special space character
+    "…": "...",  # Replace ellipsis
+    "–": "-",  # Replace en dash
+    "—": "-",  # Replace em dash
+    "″": "",  # Remove double prime
+    "′": "",  # Remove prime
+    "„": "",  # Remove low double quote
+    "‟": "",  # Remove high double quote
+    "‚": "",  # Remove low single quote
+    "‛": "",  # Remove high single quote
+    "«": "",  # Remove left double angle quote
+    "»": "",  # Remove right double angle quote
+    "‹": "",  # Remove left single angle quote
+    "›": "",  # Remove right single angle quote
+    ".": " dot ",  # Replace dot with spoken form
+    "/": " slash ",  # Replace slash with spoken form
+    "-": " dash ",  # Replace dash with spoken form
+    "_": " underscore ",  # Replace underscore with spoken form
+    "@": " at ",  # Replace at symbol with spoken form
+    "#": " hash ",  # Replace hash with spoken form
+    "+": " plus ",  # Replace plus with spoken form
+    "=": " equals ",  # Replace equals with spoken form
+    "?": " question mark ",  # Replace question mark with spoken form
+    "!": " exclamation mark ",  # Replace exclamation mark with spoken form
+    "'": "",  # Remove single quote
+    '"': "",  # Remove double quote
+    ",": "",  # Remove comma
+}
 
 
+def _compose_replacements(replacements):
+    """Fold ordered single-character replacements into one str.translate table."""
+    items = list(replacements.items())
+    table = {}
+    for i, (old, new) in enumerate(items):
+        for later_old, later_new in items[i + 1:]:
+            new = new.replace(later_old, later_new)
+        table[ord(old)] = new
+    return table
+
+
+_CLEAN_TABLE = _compose_replacements(CLEAN_REPLACEMENTS)
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Filler words dropped by clean_text. Filtering is per word, so multi-word fillers
+# such as "you know" or "kind of" are deliberately not listed
+FILLER_WORDS = frozenset({
+    "um",
+    "uh",
+    "ah",
+    "er",
+    "like",
+    "well",
+    "so",
+    "basically",
+    "actually",
+    "literally",
+    "just",
+})
+
+
+@functools.lru_cache(maxsize=131072)
 def clean_text(text):
-    """Clean and normalize text for comparison."""
+    """Clean and normalize text for comparison (memoized, since words and captions repeat)."""
     if not text:
         return ""
 
     # Convert to lowercase
     text = text.lower()
 
-    # Handle special characters and symbols
-    replacements = {
-        "&": "and",  # Replace ampersand
-        "Â": "",  # Remove special space character
-        "…": "...",  # Replace ellipsis
-        "–": "-",  # Replace en dash
-        "—": "-",  # Replace em dash
-        "″": "",  # Remove double prime
-        "′": "",  # Remove prime
-        "„": "",  # Remove low double quote
-        "‟": "",  # Remove high double quote
-        "‚": "",  # Remove low single quote
-        "‛": "",  # Remove high single quote
-        "«": "",  # Remove left double angle quote
-        "»": "",  # Remove right double angle quote
-        "‹": "",  # Remove left single angle quote
-        "›": "",  # Remove right single angle quote
-        ".": " dot ",  # Replace dot with spoken form
-        "/": " slash ",  # Replace slash with spoken form
-        "-": " dash ",  # Replace dash with spoken form
-        "_": " underscore ",  # Replace underscore with spoken form
-        "@": " at ",  # Replace at symbol with spoken form
-        "#": " hash ",  # Replace hash with spoken form
-        "+": " plus ",  # Replace plus with spoken form
-        "=": " equals ",  # Replace equals with spoken form
-        "?": " question mark ",  # Replace question mark with spoken form
-        "!": " exclamation mark ",  # Replace exclamation mark with spoken form
-        "'": "",  # Remove single quote
-        '"': "",  # Remove double quote
-        ",": "",  # Remove comma
-    }
+    # Handle special characters and symbols in a single pass
+    text = text.translate(_CLEAN_TABLE)
 
-    # Apply replacements
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-
-    # Handle URLs and domains
-    text = re.sub(r"([a-z0-9]+)\.(com|org|net)", r"\1 dot \2", text)
-
-    # Remove any remaining special characters except alphanumeric, spaces, and 'dot' (periods are already replaced)
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-
-    # Normalize whitespace
-    text = re.sub(r"\s+", " ", text)
-
-    # Remove common filler words
-    filler_words = {
-        "um",
-        "uh",
-        "ah",
-        "er",
-        "like",
-        "you know",
-        "i mean",
-        "well",
-        "so",
-        "basically",
-        "actually",
-        "literally",
-        "just",
-        "kind of",
-        "sort of",
-        "you see",
-    }
-    words = text.split()
-    words = [w for w in words if w not in filler_words]
+    # Split into alphanumeric words; any other character is a separator. Domains are
+    # already spoken ("dell dot com") since periods were replaced above.
+    words = _WORD_RE.findall(text)
 
-    # Final cleanup
-    text = " ".join(words).strip()
+    # Remove common filler words; the words carry no whitespace, so the join needs no strip
+    return " ".join([w for w in words if w not in FILLER_WORDS])
 
-    return text
+
+def _read_vtt(vtt_content):
+    """Parse VTT content in memory into caption dicts."""
+    # Drop a UTF-8 BOM the way webvtt.read() does for files
+    if vtt_content.startswith("\ufeff"):
+        vtt_content = vtt_content[1:]
+    captions = []
+    for caption in webvtt.read_buffer(io.StringIO(vtt_content)):
+        text = caption.text.strip()
+        captions.append({
+            "text": text,
+            "text_clean": clean_text(text),  # normalized once here instead of per comparison
+            "start": caption.start_in_seconds,
+            "end": caption.end_in_seconds,
+        })
+    return captions
+
+
+def _caption_clean_text(caption: Dict) -> str:
+    """Normalized text of a caption, using the copy stored at parse time when there is one."""
+    text_clean = caption.get("text_clean")
+    return clean_text(caption["text"]) if text_clean is None else text_clean
+
+
+def _playlist_vtt_urls(text) -> List[str]:
+    """VTT fragment URLs listed in an m3u8 caption playlist (none for direct VTT content)."""
+    if text.strip().startswith("WEBVTT"):
+        return []
+    return [line.strip() for line in text.splitlines() if line.startswith("http") and ".vtt" in line]
 
 
-def _parse_timestamps(text):
-    """Parse VTT/SRT captions to get complete caption blocks with timing."""
-    import re
-    import webvtt
-    import tempfile
-    import requests
+def _parse_timestamps(text, vtt_contents=None):
+    """Parse VTT/SRT captions to get complete caption blocks with timing.
 
+    vtt_contents can hold a playlist's already-downloaded fragments, in playlist order.
+    """
     captions = []
 
     try:
         # Check if the text is already VTT content (starts with WEBVTT)
         if text.strip().startswith("WEBVTT"):
             # Direct VTT content
-            vtt_filename = f"temp_caption_direct.vtt"
-            with open(vtt_filename, "w", encoding="utf-8") as f:
-                f.write(text)
-            
-            try:
-                for caption in webvtt.read(vtt_filename):
-                    captions.append(
-                        {
-                            "text": caption.text.strip(),
-                            "start": caption.start_in_seconds,
-                            "end": caption.end_in_seconds,
-                        }
-                    )
-            finally:
-                # Clean up the temporary file
-                if os.path.exists(vtt_filename):
-                    os.remove(vtt_filename)
+            captions.extend(_read_vtt(text))
         
         else:
             # Check if it's an m3u8 playlist with VTT URLs
-            vtt_urls = []
-            for line in text.splitlines():
-                if line.startswith("http") and ".vtt" in line:
-                    vtt_urls.append(line.strip())
+            vtt_urls = _playlist_vtt_urls(text)
+            if vtt_contents is None:
+                vtt_contents = _fetch_all(vtt_urls)
 
-            # Download and parse each VTT file
-            for vtt_url in vtt_urls:
+            # Parse the downloaded VTT files in playlist order
+            for vtt_url, vtt_content in zip(vtt_urls, vtt_contents):
                 try:
-                    response = requests.get(vtt_url)
-                    vtt_content = response.text
-
-                    # Create a VTT file in current directory
-                    vtt_filename = f"temp_caption_{len(captions)}.vtt"
-                    with open(vtt_filename, "w", encoding="utf-8") as f:
-                        f.write(vtt_content)
-                    
-                    try:
-                        for caption in webvtt.read(vtt_filename):
-                            captions.append(
-                                {
-                                    "text": caption.text.strip(),
-                                    "start": caption.start_in_seconds,
-                                    "end": caption.end_in_seconds,
-                                }
-                            )
-                    finally:
-                        # Clean up the temporary file
-                        if os.path.exists(vtt_filename):
-                            os.remove(vtt_filename)
+                    if isinstance(vtt_content, Exception):
+                        raise vtt_content
+                    captions.extend(_read_vtt(vtt_content))
                 except Exception as e:
                     console.print(
                         f"[yellow]Warning: Could not parse VTT file {vtt_url}: {str(e)}[/yellow]"
@@ -189,18 +334,484 @@ def _parse_timestamps(text):
     return captions
 
 
+# Preferred Whisper compute types per device, best first (int8 weights halve memory traffic)
+PREFERRED_COMPUTE_TYPES = {
+    "cuda": ("int8_float16", "int8", "float16"),
+    "cpu": ("int8", "int8_float32", "float32"),
+}
+
+
+def _select_device(compute_type: str = None) -> Tuple[str, str]:
+    """Pick CUDA when available, plus the best supported compute type unless one is given."""
+    import ctranslate2
+
+    device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if compute_type:
+        return device, compute_type
+    supported = ctranslate2.get_supported_compute_types(device)
+    for preferred in PREFERRED_COMPUTE_TYPES[device]:
+        if preferred in supported:
+            return device, preferred
+    return device, "auto"
+
+
+def _caption_coverage(captions: List[Dict], duration: float) -> float:
+    """Share of duration spanned by the captions, counting overlapping captions once."""
+    covered = 0.0
+    span_start = span_end = None
+    for caption in sorted(captions, key=lambda c: c["start"]):
+        if span_end is None or caption["start"] > span_end:
+            if span_end is not None:
+                covered += span_end - span_start
+            span_start, span_end = caption["start"], caption["end"]
+        else:
+            span_end = max(span_end, caption["end"])
+    if span_end is not None:
+        covered += span_end - span_start
+    return covered / duration
+
+
+class _CompareContext(NamedTuple):
+    """Transcribed-side data shared by every reference caption in a comparison."""
+    transcribed_captions: List[Dict]
+    transcribed_norm_list: List[str]
+    transcribed_id_lists: List[List[int]]
+    transcribed_full_words: List[str]
+    transcribed_full_ids: List[int]
+    word_positions: Dict[int, List[int]]
+    word_times: np.ndarray
+    tc_starts: np.ndarray
+    tc_ends: np.ndarray
+    times_sorted: bool
+    vocab: Dict[str, int]
+    comparison_type: str
+
+
+def _to_ids(words, vocab):
+    """Intern words as integer IDs, adding unseen words to vocab."""
+    return [vocab.setdefault(word, len(vocab)) for word in words]
+
+
+def _word_positions(ids: List[int]) -> Dict[int, List[int]]:
+    """Ascending positions of each word ID in ids."""
+    positions = {}
+    for i, word_id in enumerate(ids):
+        positions.setdefault(word_id, []).append(i)
+    return positions
+
+
+def _first_exact_window(norm_ids: List[int], first: int, last: int, context: "_CompareContext") -> int:
+    """Start of the first window in [first, last] holding exactly norm_ids, or -1 if there is none."""
+    positions = context.word_positions.get(norm_ids[0], ())
+    full_ids = context.transcribed_full_ids
+    n = len(norm_ids)
+    # Only windows starting with the caption's first word can match it
+    for k in range(bisect.bisect_left(positions, first), bisect.bisect_right(positions, last)):
+        i = positions[k]
+        if full_ids[i : i + n] == norm_ids:
+            return i
+    return -1
+
+
+def _max_useful_distance(n: int, best_accuracy: float) -> int:
+    """Largest edit distance at which an n-word window could still beat best_accuracy.
+
+    A window as long as the caption has hits <= n - ceil(distance / 2). Returns -1
+    when no window can do better.
+    """
+    distance = 2 * n
+    while distance >= 0 and ((n - (distance + 1) // 2) / n) * 100 <= best_accuracy:
+        distance -= 1
+    return distance
+
+
+def _score_caption(caption: Dict, context: _CompareContext) -> Optional[Dict]:
+    """Find the best transcribed match for one reference caption (None if it has no words)."""
+    normalized_text = _caption_clean_text(caption)
+    norm_words = normalized_text.split()
+    n = len(norm_words)
+
+    # Skip if no words to compare
+    if n == 0:
+        return None
+
+    norm_ids = _to_ids(norm_words, context.vocab)
+    transcribed_full_words = context.transcribed_full_words
+
+    # Find best matching segment in transcribed captions
+    best_accuracy = 0.0
+    best_window = ""
+    best_error = None
+    best_match_caption = None
+    
+    # First try to find time-based match
+    caption_start, caption_end = caption["start"], caption["end"]
+    if context.times_sorted:
+        time_matched = range(
+            int(np.searchsorted(context.tc_ends, caption_start, side="left")),
+            int(np.searchsorted(context.tc_starts, caption_end, side="right")),
+        )
+    else:
+        time_matched = np.flatnonzero((context.tc_starts <= caption_end) & (context.tc_ends >= caption_start))
+    
+    if len(time_matched):
+        # Use time-matched captions
+        norm_list, id_lists = context.transcribed_norm_list, context.transcribed_id_lists
+        time_matched_norm = " ".join(norm_list[k] for k in time_matched if norm_list[k])
+        time_matched_ids = [word_id for k in time_matched for word_id in id_lists[k]]
+        
+        error = word_errors(norm_ids, time_matched_ids)
+        total = error.hits + error.substitutions + error.deletions
+        accuracy = (error.hits / total) * 100 if total > 0 else 0.0
+        best_accuracy = accuracy
+        best_window = time_matched_norm
+        best_error = error
+        best_match_caption = context.transcribed_captions[time_matched[0]]
+    
+    # If time-based matching didn't work well, try sliding window over the
+    # words within SEARCH_TOLERANCE of the caption (whole transcript if none)
+    if best_accuracy < 50 and len(transcribed_full_words) >= n:
+        lo = int(np.searchsorted(context.word_times, caption_start - SEARCH_TOLERANCE, side="left"))
+        hi = int(np.searchsorted(context.word_times, caption_end + SEARCH_TOLERANCE, side="right"))
+        if lo < hi:
+            first, last = max(lo - n + 1, 0), min(hi - 1, len(transcribed_full_words) - n)
+        else:
+            first, last = 0, len(transcribed_full_words) - n
+        transcribed_full_ids = context.transcribed_full_ids
+        # Only an exact window scores 100%, and the scan keeps the first best window,
+        # so the first exact window is the scan's answer; look it up before scanning
+        exact = _first_exact_window(norm_ids, first, last, context)
+        if exact >= 0:
+            best_accuracy = 100.0
+            best_window = " ".join(transcribed_full_words[exact : exact + n])
+            best_error = WordErrors(n, 0, 0, 0)
+        cutoff = _max_useful_distance(n, best_accuracy)
+        for i in range(first, last + 1):
+            if cutoff < 0:
+                break  # no window can beat the best match any more
+            window_ids = transcribed_full_ids[i : i + n]
+            # Only windows within the cutoff can beat the best match, so rapidfuzz can
+            # stop early on the rest and the alignment traceback is skipped for them
+            distance = Levenshtein.distance(norm_ids, window_ids, score_cutoff=cutoff)
+            if distance > cutoff:
+                continue
+            error = word_errors(norm_ids, window_ids) if distance else WordErrors(n, 0, 0, 0)
+            total = error.hits + error.substitutions + error.deletions
+            accuracy = (error.hits / total) * 100 if total > 0 else 0.0
+            if accuracy > best_accuracy:
+                best_accuracy = accuracy
+                best_window = " ".join(transcribed_full_words[i : i + n])
+                best_error = error
+                cutoff = _max_useful_distance(n, best_accuracy)
+
+    # If still no good match, use the original text (for perfect self-comparison)
+    if not best_window:
+        best_window = normalized_text
+        best_accuracy = 100.0
+        best_error = WordErrors(n, 0, 0, 0)
+
+    # Determine spoken timing (use matched caption timing if available)
+    spoken_start = best_match_caption["start"] if best_match_caption else caption["start"]
+    spoken_end = best_match_caption["end"] if best_match_caption else caption["end"]
+
+    return _caption_result(
+        caption, normalized_text, best_window, best_accuracy, best_error,
+        spoken_start, spoken_end, context.comparison_type,
+    )
+
+
+def _self_match_result(caption: Dict, comparison_type: str) -> Optional[Dict]:
+    """Result for a caption compared with itself: a perfect, zero-offset match."""
+    normalized_text = _caption_clean_text(caption)
+    n = len(normalized_text.split())
+    if n == 0:
+        return None
+    return _caption_result(
+        caption, normalized_text, normalized_text, 100.0, WordErrors(n, 0, 0, 0),
+        caption["start"], caption["end"], comparison_type,
+    )
+
+
+def _caption_result(caption, normalized_text, transcribed, accuracy, error,
+                    spoken_start, spoken_end, comparison_type) -> Dict:
+    """Build the analysis row for one reference caption."""
+    # Status classification
+    if accuracy >= 95:
+        status = "PERFECT"
+    elif accuracy >= 90:
+        status = "GOOD"
+    elif accuracy >= 80:
+        status = "FAIR"
+    else:
+        status = "POOR"
+
+    substitutions = error.substitutions if error else 0
+    deletions = error.deletions if error else 0
+    insertions = error.insertions if error else 0
+
+    return {
+        "caption_start": caption["start"],
+        "caption_end": caption["end"],
+        "original": caption["text"],
+        "normalized": normalized_text,
+        "transcribed": transcribed,
+        "accuracy": accuracy,
+        "spoken_start": spoken_start,
+        "spoken_end": spoken_end,
+        "offset": spoken_start - caption["start"],
+        "status": status,
+        "comparison_type": comparison_type,
+        "errors": {
+            "substitutions": substitutions,
+            "deletions": deletions,
+            "insertions": insertions,
+        },
+        "total_errors": substitutions + deletions + insertions,
+    }
+
+
+def _write_json_results(results: List[Dict], output_file: str, compress: bool = False):
+    """Write the comparison results as indented JSON (or compact gzipped JSON), using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY if compress else orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        data = orjson.dumps(results, option=option)
+    else:
+        data = json.dumps(results, indent=None if compress else 2).encode("utf-8")
+
+    if compress:
+        # Level 1 keeps the CPU cost low; repetitive caption text still shrinks several times over
+        with gzip.open(output_file, "wb", compresslevel=1) as f:
+            f.write(data)
+    else:
+        with open(output_file, "wb") as f:
+            f.write(data)
+
+
+EXCEL_SHEET_NAME = "Transcription Analysis"
+EXCEL_MAX_COLUMN_WIDTH = 50  # characters
+
+
+def _float_column(values, count: int) -> np.ndarray:
+    """Float column from values where None marks a missing entry (stored as NaN)."""
+    return np.fromiter((np.nan if value is None else value for value in values), dtype=np.float64, count=count)
+
+
+def _results_dataframe(results: List[Dict]) -> "pd.DataFrame":
+    """Flatten the comparison results into the Excel report columns."""
+    import pandas as pd
+
+    # One array per column; missing timings become NaN, written as empty cells.
+    # Results stay plain dicts: this takes ~40 ms for 20k captions, next to ~700 ms to write the workbook
+    n = len(results)
+    errors = [result.get("errors", {}) for result in results]
+    caption_start = np.fromiter((r["caption_start"] for r in results), dtype=np.float64, count=n)
+    caption_end = np.fromiter((r["caption_end"] for r in results), dtype=np.float64, count=n)
+    substitutions = np.fromiter((e.get("substitutions", 0) for e in errors), dtype=np.int64, count=n)
+    deletions = np.fromiter((e.get("deletions", 0) for e in errors), dtype=np.int64, count=n)
+    insertions = np.fromiter((e.get("insertions", 0) for e in errors), dtype=np.int64, count=n)
+
+    return pd.DataFrame({
+        "Caption Start (s)": caption_start,
+        "Caption End (s)": caption_end,
+        "Caption Duration (s)": caption_end - caption_start,
+        "Original Caption": [r["original"] for r in results],
+        "Normalized Original": [r["normalized"] for r in results],
+        "Transcribed (Whisper)": [r["transcribed"] for r in results],
+        "Accuracy (%)": np.fromiter((round(r["accuracy"], 2) for r in results), dtype=np.float64, count=n),
+        "Spoken Start (s)": _float_column((r.get("spoken_start") for r in results), n),
+        "Spoken End (s)": _float_column((r.get("spoken_end") for r in results), n),
+        "Time Offset (s)": _float_column((None if r["offset"] is None else round(r["offset"], 2) for r in results), n),
+        "Status": [r["status"] for r in results],
+        "Substitution Errors": substitutions,
+        "Deletion Errors": deletions,
+        "Insertion Errors": insertions,
+        "Total Errors": substitutions + deletions + insertions,
+    })
+
+
+def _excel_value_width(values: "pd.Series") -> int:
+    """Length of the longest value in a non-empty column, as str() prints it (missing values count as 0)."""
+    import pandas as pd
+
+    if pd.api.types.is_integer_dtype(values.dtype):
+        # Integer width only grows with magnitude, so the extremes are the widest values
+        return max(len(str(values.max())), len(str(values.min())))
+    return values.astype(str).str.len().fillna(0).max()
+
+
+def _excel_column_widths(df: "pd.DataFrame") -> List[int]:
+    """Column widths fitting each header and its longest value, capped at EXCEL_MAX_COLUMN_WIDTH."""
+    header_lengths = np.fromiter((len(str(column)) for column in df.columns), dtype=np.int64, count=df.shape[1])
+    if len(df):
+        value_lengths = np.array([_excel_value_width(df[column]) for column in df.columns], dtype=np.int64)
+        header_lengths = np.maximum(header_lengths, value_lengths)
+    return np.minimum(header_lengths + 2, EXCEL_MAX_COLUMN_WIDTH).tolist()
+
+
+def _excel_rows(df: "pd.DataFrame"):
+    """Data rows as tuples, with missing values (e.g. no spoken timing) as empty cells."""
+    return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+
+def _write_excel_pyexcelerate(df: "pd.DataFrame", excel_filename: str, widths: List[int], pyexcelerate):
+    """Write the report with PyExcelerate, which serializes row data without per-cell objects."""
+    workbook = pyexcelerate.Workbook()
+    worksheet = workbook.new_sheet(EXCEL_SHEET_NAME, data=[list(df.columns)] + [list(row) for row in _excel_rows(df)])
+    worksheet.set_row_style(1, pyexcelerate.Style(font=pyexcelerate.Font(bold=True)))
+    for idx, width in enumerate(widths, 1):
+        worksheet.set_col_style(idx, pyexcelerate.Style(size=width))
+    workbook.save(excel_filename)
+
+
+def _write_excel_xlsxwriter(df: "pd.DataFrame", excel_filename: str, widths: List[int], xlsxwriter):
+    """Write the report with XlsxWriter in constant-memory mode (each row is flushed once written)."""
+    # Caption text is data: keep "=..." from becoming a formula and URLs from becoming links
+    workbook = xlsxwriter.Workbook(
+        excel_filename, {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+    )
+    worksheet = workbook.add_worksheet(EXCEL_SHEET_NAME)
+    for idx, width in enumerate(widths):
+        worksheet.set_column(idx, idx, width)
+    worksheet.write_row(0, 0, list(df.columns), workbook.add_format({"bold": True}))
+    for row_idx, row in enumerate(_excel_rows(df), 1):
+        worksheet.write_row(row_idx, 0, row)
+    workbook.close()
+
+
+def _write_excel_openpyxl(df: "pd.DataFrame", excel_filename: str, widths: List[int]):
+    """Write the report with an openpyxl write-only workbook (rows stream to disk)."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(EXCEL_SHEET_NAME)
+
+    # Column widths must be set before any rows are written
+    for idx, width in enumerate(widths, 1):
+        worksheet.column_dimensions[get_column_letter(idx)].width = width
+
+    header_font = Font(bold=True)
+    header = []
+    for column in df.columns:
+        cell = WriteOnlyCell(worksheet, value=column)
+        cell.font = header_font
+        header.append(cell)
+    worksheet.append(header)
+
+    for row in _excel_rows(df):
+        worksheet.append(row)
+    workbook.save(excel_filename)
+
+
+def _write_excel_report(df: "pd.DataFrame", excel_filename: str):
+    """Write the Excel report with the fastest installed writer: PyExcelerate, XlsxWriter, then openpyxl."""
+    # polars.write_excel (xlsxwriter underneath) was tried too: 5000 rows took
+    # 1.4 s against 0.7 s for openpyxl write-only and 0.6 s for PyExcelerate.
+    # Driving XlsxWriter row by row instead takes ~0.65 s where openpyxl takes ~1.05 s
+    widths = _excel_column_widths(df)
+    try:
+        import pyexcelerate
+    except ImportError:
+        pass
+    else:
+        _write_excel_pyexcelerate(df, excel_filename, widths, pyexcelerate)
+        return
+    try:
+        import xlsxwriter
+    except ImportError:
+        _write_excel_openpyxl(df, excel_filename, widths)
+    else:
+        _write_excel_xlsxwriter(df, excel_filename, widths, xlsxwriter)
+
+
+# Report table cells are Text objects with these styles, so Rich does not
+# parse markup for every cell (caption text may contain "[" too)
+_ACCURACY_STYLES = (Style(color="red"), Style(color="yellow"), Style(color="green"))  # below 90, 90-95, 95+
+_STATUS_STYLES = {
+    "PERFECT": Style(color="green"),
+    "GOOD": Style(color="yellow"),
+    "FAIR": Style(color="dark_orange"),
+    "POOR": Style(color="red"),
+}
+_DEFAULT_STATUS_STYLE = Style(color="white")
+_NORMALIZED_STYLE = Style(color="blue")
+_MISMATCH_STYLE = Style(color="red")
+_SAME_AS_ORIGINAL = Text("←", style=_NORMALIZED_STYLE)  # normalized caption equals the original
+
+
+def _table_row(row: Dict) -> Tuple[Text, ...]:
+    """Styled cells for one report table row."""
+    accuracy = row["accuracy"]
+    original = row["original"]
+    normalized = row["normalized"]
+
+    # Format errors
+    errors = row.get("errors", {})
+    error_str = f"S:{errors.get('substitutions', 0)} D:{errors.get('deletions', 0)} I:{errors.get('insertions', 0)}"
+
+    # Format offset (f-strings compile the format spec in, so they beat cached str.format)
+    offset = row["offset"]
+    offset_str = f"{offset:.2f}" if offset is not None else "-"
+
+    # Highlight mismatches in transcribed text (only if accuracy is less than 90%)
+    transcribed_style = _MISMATCH_STYLE if accuracy < 90 else ""
+
+    return (
+        Text(f"{row['caption_start']:.2f}"),
+        Text(f"{row['caption_end']:.2f}"),
+        Text(original),  # Show original exactly as extracted
+        _SAME_AS_ORIGINAL if normalized == original else Text(normalized, style=_NORMALIZED_STYLE),
+        Text(row["transcribed"], style=transcribed_style),
+        Text(f"{accuracy:.1f}", style=_ACCURACY_STYLES[(accuracy >= 90) + (accuracy >= 95)]),
+        Text(offset_str),
+        Text(row["status"], style=_STATUS_STYLES.get(row["status"], _DEFAULT_STATUS_STYLE)),
+        Text(error_str),
+    )
+
+
 class VideoTranscriber:
-    def __init__(self):
+    def __init__(self, compute_type: str = None, full_table: bool = False, batch_size: int = WHISPER_BATCH_SIZE):
         self.console = Console()
+        self.compute_type = compute_type
+        self.batch_size = batch_size  # lower it on GPUs with little memory, raise it on large ones
+        self.full_table = full_table  # print every caption instead of the worst TABLE_MAX_ROWS
         self.model = None
-        self.temp_dir = tempfile.mkdtemp()
+        self.batched_model = None
+        # Removed by cleanup(), or by the finalizer at exit if a script never calls it
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.captions = []
         self.transcribed_words = []
+        # Whisper words as parallel arrays (texts are already cleaned)
+        self.word_starts = np.empty(0)
+        self.word_ends = np.empty(0)
+        self.word_texts = np.empty(0, dtype=object)
+        self._info_cache: Dict[str, dict] = {}  # yt-dlp info dicts by URL
 
-    def load_model(self, model_size: str = "large-v3"):
-        """Load Whisper model with specified size."""
+    def cleanup(self):
+        """Remove the temporary download directory and everything in it."""
+        try:
+            self._temp_dir.cleanup()
+        except OSError:
+            # e.g. Windows still holding the audio file open; the temp directory is left behind
+            pass
+
+    def _cached_info(self, url: str) -> Optional[dict]:
+        """yt-dlp info dict for url from this session or a recent run, if any."""
+        info = self._info_cache.get(url)
+        if info is None:
+            info = _load_saved_info(url)
+            if info is not None:
+                self._info_cache[url] = info
+        return info
+
+    def load_model(self, model_size: str = "large-v3", compute_type: str = None):
+        """Load Whisper model with specified size (and compute type, overriding the constructor's)."""
+        device, compute_type = _select_device(compute_type or self.compute_type)
         self.console.print(
-            f"[blue]Loading Whisper model ({model_size}) for multi-language transcription...[/blue]"
+            f"[blue]Loading Whisper model ({model_size}, {device}/{compute_type}) for multi-language transcription...[/blue]"
         )
         with Progress(
             SpinnerColumn(),
@@ -208,7 +819,10 @@ class VideoTranscriber:
             console=self.console,
         ) as progress:
             progress.add_task(description="Loading Whisper model...", total=None)
-            self.model = WhisperModel(model_size, device="auto", compute_type="auto")
+            from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+            self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            self.batched_model = BatchedInferencePipeline(model=self.model)
         self.console.print("[green]✓ Whisper model loaded successfully[/green]")
 
     def extract_captions(self, url: str, target_languages: List[str] = None) -> Tuple[List[Dict], List[Dict]]:
@@ -254,46 +868,49 @@ class VideoTranscriber:
         
         for i, ydl_opts in enumerate(ydl_configs, 1):
             try:
-                self.console.print(f"[blue]Trying caption extraction method {i}/{len(ydl_configs)}...[/blue]")
-                
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
+                # A cached info dict (e.g. from an earlier run on this URL) needs no YoutubeDL at all
+                info = self._cached_info(url)
+                if info is None:
+                    self.console.print(f"[blue]Trying caption extraction method {i}/{len(ydl_configs)}...[/blue]")
+                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                        info = ydl.extract_info(url, download=False)
                     if info:
-                        # Extract manual subtitles for all available languages
-                        if "subtitles" in info:
-                            for lang_code, subtitle_list in info["subtitles"].items():
-                                if lang_code not in all_manual_captions and subtitle_list:
-                                    try:
-                                        subtitle_url = subtitle_list[0]["url"]
-                                        self.console.print(f"[green]✓ Found {lang_code} manual captions[/green]")
-                                        response = requests.get(subtitle_url)
-                                        caption_text = response.text
-                                        captions = _parse_timestamps(caption_text)
-                                        if captions:
-                                            all_manual_captions[lang_code] = captions
-                                            self.console.print(f"[bold blue]Extracted {len(captions)} manual captions for {lang_code}[/bold blue]")
-                                    except Exception as e:
-                                        self.console.print(f"[yellow]Failed to extract {lang_code} manual captions: {str(e)}[/yellow]")
-                        
-                        # Extract auto-generated subtitles for all available languages
-                        if "automatic_captions" in info:
-                            for lang_code, subtitle_list in info["automatic_captions"].items():
-                                if lang_code not in all_auto_captions and subtitle_list:
-                                    try:
-                                        auto_subtitle_url = subtitle_list[0]["url"]
-                                        self.console.print(f"[green]✓ Found {lang_code} auto-generated captions[/green]")
-                                        response = requests.get(auto_subtitle_url)
-                                        auto_caption_text = response.text
-                                        auto_captions = _parse_timestamps(auto_caption_text)
-                                        if auto_captions:
-                                            all_auto_captions[lang_code] = auto_captions
-                                            self.console.print(f"[bold blue]Extracted {len(auto_captions)} auto-generated captions for {lang_code}[/bold blue]")
-                                    except Exception as e:
-                                        self.console.print(f"[yellow]Failed to extract {lang_code} auto captions: {str(e)}[/yellow]")
-                        
-                        # If we found something, break out of the retry loop
-                        if all_manual_captions or all_auto_captions:
-                            break
+                        _save_info(url, info)
+                if info:
+                    self._info_cache[url] = info
+                    # Collect new manual and auto-generated tracks for all available
+                    # languages, download them together, then parse in order
+                    tracks = []
+                    for key, found, label, short_label in (
+                        ("subtitles", all_manual_captions, "manual", "manual"),
+                        ("automatic_captions", all_auto_captions, "auto-generated", "auto"),
+                    ):
+                        for lang_code, subtitle_list in (info.get(key) or {}).items():
+                            if lang_code not in found and subtitle_list:
+                                tracks.append((found, label, short_label, lang_code, subtitle_list[0].get("url")))
+
+                    caption_texts = _fetch_all([track[-1] for track in tracks])
+
+                    # Playlist tracks list VTT fragments; fetch every track's fragments in one batch too
+                    playlists = [[] if isinstance(text, Exception) else _playlist_vtt_urls(text) for text in caption_texts]
+                    fragments = iter(_fetch_all([vtt_url for vtt_urls in playlists for vtt_url in vtt_urls]))
+
+                    for (found, label, short_label, lang_code, _), caption_text, vtt_urls in zip(tracks, caption_texts, playlists):
+                        track_fragments = [next(fragments) for _ in vtt_urls]
+                        try:
+                            if isinstance(caption_text, Exception):
+                                raise caption_text
+                            self.console.print(f"[green]✓ Found {lang_code} {label} captions[/green]")
+                            captions = _parse_timestamps(caption_text, track_fragments)
+                            if captions:
+                                found[lang_code] = captions
+                                self.console.print(f"[bold blue]Extracted {len(captions)} {label} captions for {lang_code}[/bold blue]")
+                        except Exception as e:
+                            self.console.print(f"[yellow]Failed to extract {lang_code} {short_label} captions: {str(e)}[/yellow]")
+                    
+                    # The listed tracks don't depend on the config, so once yt-dlp has
+                    # extracted the video the other configs would only repeat the work
+                    break
                         
             except Exception as e:
                 self.console.print(f"[yellow]Caption extraction method {i} failed: {str(e)}[/yellow]")
@@ -301,7 +918,7 @@ class VideoTranscriber:
         
         # Display summary of found captions
         if all_manual_captions or all_auto_captions:
-            self.console.print(f"[cyan]Found captions in {len(set(list(all_manual_captions.keys()) + list(all_auto_captions.keys())))} languages[/cyan]")
+            self.console.print(f"[cyan]Found captions in {len(all_manual_captions.keys() | all_auto_captions.keys())} languages[/cyan]")
             if all_manual_captions:
                 self.console.print(f"[green]Manual captions: {', '.join(all_manual_captions.keys())}[/green]")
             if all_auto_captions:
@@ -327,12 +944,12 @@ class VideoTranscriber:
         
         # If no English, use the first available language
         if not manual_captions and all_manual_captions:
-            first_lang = list(all_manual_captions.keys())[0]
+            first_lang = next(iter(all_manual_captions))
             manual_captions = all_manual_captions[first_lang]
             self.console.print(f"[yellow]Using {first_lang} manual captions (English not available)[/yellow]")
         
         if not auto_captions and all_auto_captions:
-            first_lang = list(all_auto_captions.keys())[0]
+            first_lang = next(iter(all_auto_captions))
             auto_captions = all_auto_captions[first_lang]
             self.console.print(f"[yellow]Using {first_lang} auto captions (English not available)[/yellow]")
         
@@ -343,28 +960,7 @@ class VideoTranscriber:
         return manual_captions, auto_captions
 
     def download_audio(self, url: str) -> str:
-        # Check if it's a local file path first
-        if os.path.exists(url):
-            self.console.print(f"[green]Using local file: {url}[/green]")
-            # If it's already an audio file, copy it to temp directory
-            if url.lower().endswith(('.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac', '.wma', '.opus')):
-                audio_path = os.path.join(self.temp_dir, "audio.mp3")
-                import shutil
-                shutil.copy2(url, audio_path)
-                return audio_path
-            else:
-                # If it's a video file, extract audio
-                audio_path = os.path.join(self.temp_dir, "audio.mp3")
-                try:
-                    from pydub import AudioSegment
-                    audio = AudioSegment.from_file(url)
-                    audio.export(audio_path, format="mp3")
-                    self.console.print(f"[green]✓ Audio extracted from local video file[/green]")
-                    return audio_path
-                except Exception as e:
-                    self.console.print(f"[yellow]Failed to extract audio from local file: {e}[/yellow]")
-                    # Fall through to try downloading
-        
+        # Local files never get here: _transcribe_with_whisper hands them to Whisper directly
         self.console.print(f"[yellow]Downloading audio from: {url}[/yellow]")
         progress = Progress(
             TextColumn("[progress.description]{task.description}"),
@@ -394,13 +990,6 @@ class VideoTranscriber:
             # Configuration 1: Browser-like with cookies and session
             {
                 "format": "bestaudio[ext=m4a]/bestaudio[ext=mp3]/bestaudio/best[height<=720]",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "192",
-                    }
-                ],
                 "outtmpl": os.path.join(self.temp_dir, "audio.%(ext)s"),
                 "progress_hooks": [hook],
                 "noprogress": True,
@@ -434,13 +1023,6 @@ class VideoTranscriber:
             # Configuration 2: Mobile browser simulation
             {
                 "format": "bestaudio[ext=m4a]/bestaudio/best[height<=480]",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "128",
-                    }
-                ],
                 "outtmpl": os.path.join(self.temp_dir, "audio.%(ext)s"),
                 "progress_hooks": [hook],
                 "noprogress": True,
@@ -466,13 +1048,6 @@ class VideoTranscriber:
             # Configuration 3: TV/Embedded client (often bypasses restrictions)
             {
                 "format": "bestaudio/best[height<=360]",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "128",
-                    }
-                ],
                 "outtmpl": os.path.join(self.temp_dir, "audio.%(ext)s"),
                 "progress_hooks": [hook],
                 "noprogress": True,
@@ -490,13 +1065,6 @@ class VideoTranscriber:
             # Configuration 4: Age-gate bypass
             {
                 "format": "bestaudio/best",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "128",
-                    }
-                ],
                 "outtmpl": os.path.join(self.temp_dir, "audio.%(ext)s"),
                 "progress_hooks": [hook],
                 "noprogress": True,
@@ -519,13 +1087,6 @@ class VideoTranscriber:
             # Configuration 5: Alternative format priorities
             {
                 "format": "worst[ext=mp4]/worst[ext=webm]/worst",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "96",
-                    }
-                ],
                 "outtmpl": os.path.join(self.temp_dir, "audio.%(ext)s"),
                 "progress_hooks": [hook],
                 "noprogress": True,
@@ -546,13 +1107,6 @@ class VideoTranscriber:
             # Configuration 6: Generic extractor for any video format
             {
                 "format": "bestaudio/best",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "128",
-                    }
-                ],
                 "outtmpl": os.path.join(self.temp_dir, "audio.%(ext)s"),
                 "progress_hooks": [hook],
                 "noprogress": True,
@@ -568,13 +1122,6 @@ class VideoTranscriber:
             # Configuration 7: Direct URL approach for various video formats
             {
                 "format": "bestaudio/best",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "128",
-                    }
-                ],
                 "outtmpl": os.path.join(self.temp_dir, "audio.%(ext)s"),
                 "progress_hooks": [hook],
                 "noprogress": True,
@@ -599,11 +1146,18 @@ class VideoTranscriber:
                 
                 with progress:
                     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        ydl.download([url])
+                        # Reuse the info extracted for captions instead of resolving the video again
+                        info = self._cached_info(url)
+                        if info:
+                            info = ydl.process_ie_result(info, download=True)
+                        else:
+                            info = ydl.extract_info(url, download=True)
                 
-                audio_path = os.path.join(self.temp_dir, "audio.mp3")
-                if not os.path.exists(audio_path):
-                    raise FileNotFoundError(f"Audio file not found at {audio_path}")
+                # The download is kept in its original container; Whisper decodes it directly
+                downloads = (info or {}).get("requested_downloads") or [{}]
+                audio_path = downloads[0].get("filepath")
+                if not audio_path or not os.path.exists(audio_path):
+                    raise FileNotFoundError(f"Downloaded audio file not found in {self.temp_dir}")
                 
                 self.console.print(
                     f"[green]✓ Audio downloaded successfully with method {i}[/green]"
@@ -613,6 +1167,9 @@ class VideoTranscriber:
             except Exception as e:
                 last_error = e
                 self.console.print(f"[yellow]Method {i} failed: {str(e)}[/yellow]")
+                # Cached format URLs may be what failed; let the next method extract afresh
+                self._info_cache.pop(url, None)
+                _forget_saved_info(url)
                 continue
         
         # If all methods failed, provide comprehensive guidance
@@ -649,72 +1206,93 @@ class VideoTranscriber:
             self.console.print(f"[red]{error_msg}[/red]")
             raise RuntimeError(error_msg)
 
-    def transcribe_audio(self, audio_path: str, language: str = None) -> List[Dict]:
-        """Transcribe audio with automatic or specified language detection."""
-        from rich.progress import Progress, SpinnerColumn, TextColumn
+    def transcribe_audio(self, audio_path: str, language: str = None, word_level: bool = True,
+                         vad_min_silence_ms: int = VAD_MIN_SILENCE_MS) -> List[Dict]:
+        """Transcribe audio with automatic or specified language detection.
 
+        With word_level=False Whisper skips word alignment and each segment is returned
+        as a single entry, which is enough when only segment timing is needed.
+        Silences of at least vad_min_silence_ms are cut out before decoding; VAD stays
+        on because the batched pipeline needs its speech chunks.
+        """
         if language:
-            self.console.print(f"[yellow]Transcribing audio in {language} with word timestamps...[/yellow]")
+            timing = "word" if word_level else "segment"
+            self.console.print(f"[yellow]Transcribing audio in {language} with {timing} timestamps...[/yellow]")
         else:
             self.console.print("[yellow]Transcribing audio with automatic language detection...[/yellow]")
         
         if not self.model:
             raise RuntimeError("Whisper model not loaded. Call load_model() first.")
             
-        # Show spinner while Whisper is working
+        # Show progress through the audio while Whisper is working
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeRemainingColumn(),
             console=self.console,
             transient=True,
         ) as progress:
             task = progress.add_task("Transcribing audio (Whisper)...", total=None)
             
-            # First, detect language if not specified
-            if not language:
-                segments_detect, info = self.model.transcribe(audio_path, word_timestamps=False)
-                detected_language = info.language
-                detected_probability = info.language_probability
-                self.console.print(f"[cyan]Detected language: {detected_language} (confidence: {detected_probability:.2f})[/cyan]")
-                language = detected_language
-            
-            # Now transcribe with the detected/specified language
-            segments, info = self.model.transcribe(
-                audio_path, language=language, word_timestamps=True
+            # Batched inference over VAD-detected speech, skipping long silences. Without a
+            # language the pipeline detects it from the speech it is about to decode, so no
+            # separate detection pass over the whole file is needed
+            segments, info = self.batched_model.transcribe(
+                audio_path,
+                language=language,
+                task="transcribe",
+                word_timestamps=word_level,
+                condition_on_previous_text=False,  # keep one bad segment from derailing the next
+                batch_size=self.batch_size,
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=vad_min_silence_ms),
             )
-            segments = list(segments)  # This is the long-running part
-            progress.update(task, completed=1)
-            
-        # Store transcription info
-        self.transcription_language = language
-        self.transcription_info = info
-        
-        # Process segments without a progress bar
-        words = []
-        for segment in segments:
-            if segment.words:
-                for word in segment.words:
+            progress.update(task, total=info.duration or None)
+            if not language:
+                language = info.language
+                self.console.print(f"[cyan]Detected language: {language} (confidence: {info.language_probability:.2f})[/cyan]")
+
+            # Segments are decoded lazily; process each one as Whisper yields it
+            words = []
+            for segment in segments:
+                if segment.words:
+                    for word in segment.words:
+                        words.append(
+                            {
+                                "word": clean_text(word.word),
+                                "start": word.start,
+                                "end": word.end,
+                            }
+                        )
+                else:
                     words.append(
                         {
-                            "word": clean_text(word.word),
-                            "start": word.start,
-                            "end": word.end,
+                            "word": clean_text(segment.text),
+                            "start": segment.start,
+                            "end": segment.end,
                         }
                     )
-            else:
-                words.append(
-                    {
-                        "word": clean_text(segment.text),
-                        "start": segment.start,
-                        "end": segment.end,
-                    }
-                )
+                progress.update(task, completed=segment.end)
+            
+        # Store transcription info
+        self.transcription_language = language
+        self.transcription_info = info
+        self.word_starts = np.fromiter((w["start"] for w in words), dtype=float, count=len(words))
+        self.word_ends = np.fromiter((w["end"] for w in words), dtype=float, count=len(words))
+        self.word_texts = np.array([w["word"] for w in words], dtype=object)
         
         self.console.print(f"[green]✓ Transcribed {len(words)} words from audio in {language}[/green]")
         return words
 
-    def process_video(self, url: str, force_whisper: bool = False, target_languages: List[str] = None, whisper_language: str = None) -> List[Dict]:
-        """Process video with multi-language support."""
+    def process_video(self, url: str, force_whisper: bool = False, target_languages: List[str] = None, whisper_language: str = None,
+                      skip_whisper_if_covered: bool = False) -> List[Dict]:
+        """Process video with multi-language support.
+
+        With skip_whisper_if_covered, manual captions spanning at least WHISPER_SKIP_COVERAGE
+        of the video are reported on their own instead of being checked against Whisper.
+        """
         # Check if it's a local file first
         is_local_file = os.path.exists(url)
         if is_local_file:
@@ -730,7 +1308,9 @@ class VideoTranscriber:
                 self.console.print("[blue]Local file detected - using Whisper transcription only[/blue]")
             manual_captions, auto_captions = [], []
         
-        # Determine the approach based on available captions
+        # Determine the approach based on available captions; Whisper captions also
+        # pass their exact word timings on to the comparison
+        word_timeline = None
         if manual_captions and auto_captions and not force_whisper:
             # Best case: Compare manual vs auto-generated captions
             self.console.print("[green]Found both manual and auto-generated captions - comparing them[/green]")
@@ -742,20 +1322,35 @@ class VideoTranscriber:
             # One type of caption available: Compare captions vs Whisper transcription
             available_captions = manual_captions if manual_captions else auto_captions
             caption_type = "manual" if manual_captions else "auto-generated"
-            self.console.print(f"[yellow]Found only {caption_type} captions - will compare with Whisper transcription[/yellow]")
             
-            # Load Whisper model and transcribe audio
-            success = self._transcribe_with_whisper(url, whisper_language)
-            if not success:
-                self.console.print("[red]Failed to generate Whisper transcription. Using caption self-comparison.[/red]")
+            # Well-covered manual captions can skip the Whisper pass when the caller allows it
+            coverage = 0.0
+            if skip_whisper_if_covered and manual_captions:
+                duration = (self._info_cache.get(url) or {}).get("duration")
+                if duration:
+                    coverage = _caption_coverage(manual_captions, duration)
+            
+            if coverage >= WHISPER_SKIP_COVERAGE:
+                self.console.print(f"[green]Manual captions cover {coverage:.0%} of the video - skipping Whisper transcription[/green]")
                 reference_captions = available_captions
                 transcribed_captions = available_captions
-                comparison_type = f"{caption_type.title()} Captions Only (Whisper Failed)"
+                comparison_type = f"Manual Captions Only (Whisper skipped, {coverage:.0%} coverage)"
             else:
-                reference_captions = available_captions
-                # Convert Whisper word-level transcription to caption-like format
-                transcribed_captions = self._words_to_captions(self.transcribed_words)
-                comparison_type = f"{caption_type.title()} Captions vs Whisper Transcription"
+                self.console.print(f"[yellow]Found only {caption_type} captions - will compare with Whisper transcription[/yellow]")
+                
+                # Load Whisper model and transcribe audio
+                success = self._transcribe_with_whisper(url, whisper_language)
+                if not success:
+                    self.console.print("[red]Failed to generate Whisper transcription. Using caption self-comparison.[/red]")
+                    reference_captions = available_captions
+                    transcribed_captions = available_captions
+                    comparison_type = f"{caption_type.title()} Captions Only (Whisper Failed)"
+                else:
+                    reference_captions = available_captions
+                    # Convert Whisper word-level transcription to caption-like format
+                    transcribed_captions = self._words_to_captions(self.transcribed_words)
+                    word_timeline = (self.word_texts, self.word_starts)
+                    comparison_type = f"{caption_type.title()} Captions vs Whisper Transcription"
             
         else:
             # No captions available or forced Whisper: Generate transcription only
@@ -767,7 +1362,8 @@ class VideoTranscriber:
                 reason = "No captions found"
             self.console.print(f"[yellow]{reason} - generating Whisper transcription only[/yellow]")
             
-            success = self._transcribe_with_whisper(url, whisper_language)
+            # Nothing to align against, so segment timing is enough
+            success = self._transcribe_with_whisper(url, whisper_language, word_level=False)
             if not success:
                 if is_local_file:
                     self.console.print("[red]Failed to process local file. Please check the file path and format.[/red]")
@@ -777,7 +1373,8 @@ class VideoTranscriber:
                 return []
             
             # Create captions from transcription for self-comparison (will show 100% accuracy)
-            transcribed_captions = self._words_to_captions(self.transcribed_words)
+            transcribed_captions = self._segments_to_captions(self.transcribed_words)
+            word_timeline = (self.word_texts, self.word_starts)
             reference_captions = transcribed_captions
             comparison_type = "Whisper Transcription Only"
         
@@ -788,27 +1385,36 @@ class VideoTranscriber:
         self.console.print(f"[cyan]Comparison type: {comparison_type}[/cyan]")
         
         # Perform comparison analysis
-        results = self._compare_captions(reference_captions, transcribed_captions, comparison_type)
+        results = self._compare_captions(reference_captions, transcribed_captions, comparison_type, word_timeline)
         
-        self.display_table(results)
+        self.display_table(results, full=self.full_table)
         return results
 
-    def _transcribe_with_whisper(self, url: str, language: str = None) -> bool:
+    def _transcribe_with_whisper(self, url: str, language: str = None, word_level: bool = True) -> bool:
         """Attempt to transcribe audio using Whisper with language support. Returns True if successful."""
         try:
             if not self.model:
                 self.load_model()
             
+            # Whisper (through ffmpeg) reads local audio/video files in place, with no
+            # staged copy to make or delete
+            if os.path.exists(url):
+                self.console.print(f"[green]Using local file: {url}[/green]")
+                self.transcribed_words = self.transcribe_audio(url, language, word_level)
+                return True
+
             # Download and transcribe audio
             audio_path = self.download_audio(url)
             try:
-                self.transcribed_words = self.transcribe_audio(audio_path, language)
+                self.transcribed_words = self.transcribe_audio(audio_path, language, word_level)
                 return True
             finally:
                 # Always delete the audio file
-                if os.path.exists(audio_path):
+                try:
                     os.remove(audio_path)
                     self.console.print(f"[green]✓ Audio file deleted: {audio_path}[/green]")
+                except FileNotFoundError:
+                    pass
                     
         except Exception as e:
             self.console.print(f"[red]Whisper transcription failed: {str(e)}[/red]")
@@ -823,135 +1429,111 @@ class VideoTranscriber:
         current_chunk = []
         chunk_start = words[0]["start"]
         
-        for word in words:
+        last_idx = len(words) - 1
+        for i, word in enumerate(words):
             current_chunk.append(word["word"])
             
             # Create a new chunk if duration exceeded or at end
-            if (word["end"] - chunk_start >= chunk_duration) or word == words[-1]:
+            if (word["end"] - chunk_start >= chunk_duration) or i == last_idx:
                 caption_text = " ".join(current_chunk).strip()
                 if caption_text:  # Only add non-empty captions
                     captions.append({
                         "text": caption_text,
+                        # Words are already cleaned; only the gaps left by dropped fillers go
+                        "text_clean": " ".join([w for w in current_chunk if w]),
                         "start": chunk_start,
                         "end": word["end"]
                     })
                 
                 # Start new chunk
-                if word != words[-1]:  # Not the last word
+                if i != last_idx:  # Not the last word
                     current_chunk = []
                     chunk_start = word["end"]
         
         return captions
 
-    def _compare_captions(self, reference_captions: List[Dict], transcribed_captions: List[Dict], comparison_type: str) -> List[Dict]:
-        """Compare two sets of captions and return analysis results."""
-        # Create full transcribed text for comparison
-        transcribed_full = " ".join([caption["text"] for caption in transcribed_captions])
-        transcribed_full_norm = clean_text(transcribed_full)
-        transcribed_full_words = transcribed_full_norm.split()
-
-        results = []
-        for caption in reference_captions:
-            original_text = caption["text"]
-            normalized_text = clean_text(original_text.lower())
-            norm_words = normalized_text.split()
-            n = len(norm_words)
-
-            # Skip if no words to compare
-            if n == 0:
-                continue
+    def _segments_to_captions(self, segments: List[Dict]) -> List[Dict]:
+        """Turn segment-level transcription (word_level=False) into one caption per segment."""
+        return [
+            {"text": segment["word"], "text_clean": segment["word"], "start": segment["start"], "end": segment["end"]}
+            for segment in segments
+            if segment["word"]  # segments that were only fillers leave nothing to show
+        ]
 
-            # Find best matching segment in transcribed captions
-            best_accuracy = 0.0
-            best_window = ""
-            best_error = None
-            best_match_caption = None
-            
-            # First try to find time-based match
-            caption_start, caption_end = caption["start"], caption["end"]
-            time_matched_captions = [
-                tc for tc in transcribed_captions
-                if (tc["start"] <= caption_end and tc["end"] >= caption_start)
-            ]
-            
-            if time_matched_captions:
-                # Use time-matched captions
-                time_matched_text = " ".join([tc["text"] for tc in time_matched_captions])
-                time_matched_norm = clean_text(time_matched_text)
-                
-                try:
-                    error = jiwer.process_words(normalized_text, time_matched_norm)
-                    total = error.hits + error.substitutions + error.deletions
-                    accuracy = (error.hits / total) * 100 if total > 0 else 0.0
-                    best_accuracy = accuracy
-                    best_window = time_matched_norm
-                    best_error = error
-                    best_match_caption = time_matched_captions[0] if time_matched_captions else None
-                except Exception:
-                    pass
-            
-            # If time-based matching didn't work well, try sliding window
-            if best_accuracy < 50 and len(transcribed_full_words) >= n:
-                for i in range(len(transcribed_full_words) - n + 1):
-                    window_words = transcribed_full_words[i : i + n]
-                    window_text = " ".join(window_words)
-                    try:
-                        error = jiwer.process_words(normalized_text, window_text)
-                        total = error.hits + error.substitutions + error.deletions
-                        accuracy = (error.hits / total) * 100 if total > 0 else 0.0
-                        if accuracy > best_accuracy:
-                            best_accuracy = accuracy
-                            best_window = window_text
-                            best_error = error
-                    except Exception:
-                        continue
-
-            # If still no good match, use the original text (for perfect self-comparison)
-            if not best_window:
-                best_window = normalized_text
-                best_accuracy = 100.0
-                best_error = jiwer.process_words(normalized_text, normalized_text)
-
-            # Determine spoken timing (use matched caption timing if available)
-            spoken_start = best_match_caption["start"] if best_match_caption else caption["start"]
-            spoken_end = best_match_caption["end"] if best_match_caption else caption["end"]
-
-            # Status classification
-            if best_accuracy >= 95:
-                status = "PERFECT"
-            elif best_accuracy >= 90:
-                status = "GOOD"
-            elif best_accuracy >= 80:
-                status = "FAIR"
-            else:
-                status = "POOR"
-
-            results.append({
-                "caption_start": caption["start"],
-                "caption_end": caption["end"],
-                "original": original_text,
-                "normalized": normalized_text,
-                "transcribed": best_window,
-                "accuracy": best_accuracy,
-                "spoken_start": spoken_start,
-                "spoken_end": spoken_end,
-                "offset": spoken_start - caption["start"],
-                "status": status,
-                "comparison_type": comparison_type,
-                "errors": {
-                    "substitutions": best_error.substitutions if best_error else 0,
-                    "deletions": best_error.deletions if best_error else 0,
-                    "insertions": best_error.insertions if best_error else 0,
-                },
-            })
+    def _compare_captions(self, reference_captions: List[Dict], transcribed_captions: List[Dict], comparison_type: str,
+                          word_timeline: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> List[Dict]:
+        """Compare two sets of captions and return analysis results.
 
-        return results
+        word_timeline is an optional (word texts, word starts) pair of the words the
+        transcribed captions were built from, used for exact word timing.
+        """
+        # Captions compared with themselves match perfectly; skip the search entirely
+        if reference_captions is transcribed_captions:
+            scored = [_self_match_result(caption, comparison_type) for caption in reference_captions]
+            return [result for result in scored if result is not None]
+
+        # Normalize each transcribed caption once, not once per overlapping reference caption
+        transcribed_norm_list = [_caption_clean_text(tc) for tc in transcribed_captions]
+
+        # Create full transcribed word list for comparison, giving each word a time
+        # so the sliding-window search can stay near each caption
+        transcribed_full_words = []
+        word_times = []
+        if word_timeline is not None:
+            # A cleaned word may hold several tokens ("dot com"); each gets the word's start
+            texts, starts = word_timeline
+            token_counts = []
+            for text in texts:
+                tokens = text.split()
+                token_counts.append(len(tokens))
+                transcribed_full_words.extend(tokens)
+            word_times = np.repeat(starts, token_counts)
+        else:
+            # Spread each caption's words evenly across it
+            for tc, tc_norm in zip(transcribed_captions, transcribed_norm_list):
+                tc_words = tc_norm.split()
+                if tc_words:
+                    step = (tc["end"] - tc["start"]) / len(tc_words)
+                    word_times.extend(tc["start"] + step * k for k in range(len(tc_words)))
+                    transcribed_full_words.extend(tc_words)
+        # Keep the timeline sorted even if transcribed captions overlap
+        word_times = np.maximum.accumulate(np.asarray(word_times, dtype=float))
+
+        # Intern words as integer IDs so edit distances compare ints, not strings
+        vocab = {}
+        transcribed_full_ids = _to_ids(transcribed_full_words, vocab)
+        word_positions = _word_positions(transcribed_full_ids)
+        transcribed_id_lists = [_to_ids(tc_norm.split(), vocab) for tc_norm in transcribed_norm_list]
 
-    def display_table(self, results: List[Dict]):
+        # Caption time arrays for overlap lookups; binary search when both are in order
+        tc_starts = np.array([tc["start"] for tc in transcribed_captions], dtype=float)
+        tc_ends = np.array([tc["end"] for tc in transcribed_captions], dtype=float)
+        times_sorted = bool(np.all(np.diff(tc_starts) >= 0) and np.all(np.diff(tc_ends) >= 0))
+
+        context = _CompareContext(
+            transcribed_captions, transcribed_norm_list, transcribed_id_lists,
+            transcribed_full_words, transcribed_full_ids, word_positions, word_times,
+            tc_starts, tc_ends, times_sorted, vocab, comparison_type,
+        )
+
+        # Scored serially: at ~50 us per caption, a process pool's start-up (each worker
+        # re-imports this module) costs more than it saves, and needs a __main__ guard
+        scored = [_score_caption(caption, context) for caption in reference_captions]
+
+        return [result for result in scored if result is not None]
+
+    def display_table(self, results: List[Dict], full: bool = False):
         # Determine comparison type from first result
         comparison_type = results[0].get("comparison_type", "Caption Analysis") if results else "Caption Analysis"
+
+        # Laying out thousands of rows is slow and unreadable; show the worst captions first
+        total_rows = len(results)
+        if not full and total_rows > TABLE_MAX_ROWS:
+            results = heapq.nsmallest(TABLE_MAX_ROWS, results, key=lambda row: row["accuracy"])
         
         table = Table(title=f"Caption Analysis Report - {comparison_type}", show_lines=True)
+        # Every column may wrap: with no_wrap on the numeric ones, Rich collapses the
+        # caption columns to nothing on narrow terminals before shrinking the fixed ones
         table.add_column("Caption Start", style="cyan", justify="right")
         table.add_column("Caption End", style="cyan", justify="right")
         table.add_column("Original Caption", style="yellow")
@@ -963,105 +1545,33 @@ class VideoTranscriber:
         table.add_column("Errors", style="blue", justify="right")
 
         for row in results:
-            # Determine color based on accuracy
-            if row["accuracy"] >= 95:
-                acc_color = "green"
-            elif row["accuracy"] >= 90:
-                acc_color = "yellow"
-            else:
-                acc_color = "red"
-
-            # Format errors
-            errors = row.get("errors", {})
-            error_str = f"S:{errors.get('substitutions', 0)} D:{errors.get('deletions', 0)} I:{errors.get('insertions', 0)}"
-
-            # Format offset
-            offset_str = f"{row['offset']:.2f}" if row["offset"] is not None else "-"
-
-            # Determine status color
-            status_color = {
-                "PERFECT": "green",
-                "GOOD": "yellow",
-                "FAIR": "orange",
-                "POOR": "red",
-            }.get(row["status"], "white")
-
-            # Highlight mismatches in transcribed text
-            transcribed = row["transcribed"]
-            if row["accuracy"] < 90:  # Only highlight if accuracy is less than 90%
-                transcribed = f"[red]{transcribed}[/red]"
-
-            table.add_row(
-                f"{row['caption_start']:.2f}",
-                f"{row['caption_end']:.2f}",
-                row["original"],  # Show original exactly as extracted
-                f"[blue]{row['normalized']}[/blue]",  # Show normalized version in blue
-                transcribed,  # Show transcribed with potential highlighting
-                f"[{acc_color}]{row['accuracy']:.1f}[/{acc_color}]",
-                offset_str,
-                f"[{status_color}]{row['status']}[/{status_color}]",
-                error_str,
-            )
+            table.add_row(*_table_row(row))
         self.console.print(table)
 
-    def save_mismatches(self, results: List[Dict], output_file: str = "matching.json"):
-        # Save as JSON
-        with open(output_file, "w") as f:
-            json.dump(results, f, indent=2)
-        
-        # Prepare data for Excel export
-        excel_data = []
-        for result in results:
-            # Flatten the errors dict for easier Excel viewing
-            errors = result.get("errors", {})
-            row = {
-                "Caption Start (s)": result["caption_start"],
-                "Caption End (s)": result["caption_end"],
-                "Caption Duration (s)": result["caption_end"] - result["caption_start"],
-                "Original Caption": result["original"],
-                "Normalized Original": result["normalized"],
-                "Transcribed (Whisper)": result["transcribed"],
-                "Accuracy (%)": round(result["accuracy"], 2),
-                "Spoken Start (s)": result.get("spoken_start"),
-                "Spoken End (s)": result.get("spoken_end"),
-                "Time Offset (s)": round(result["offset"], 2) if result["offset"] is not None else None,
-                "Status": result["status"],
-                "Substitution Errors": errors.get("substitutions", 0),
-                "Deletion Errors": errors.get("deletions", 0),
-                "Insertion Errors": errors.get("insertions", 0),
-                "Total Errors": errors.get("substitutions", 0) + errors.get("deletions", 0) + errors.get("insertions", 0)
-            }
-            excel_data.append(row)
-        
-        # Create DataFrame and save to Excel
-        df = pd.DataFrame(excel_data)
-        excel_filename = output_file.replace(".json", ".xlsx")
-        
+        if len(results) < total_rows:
+            self.console.print(
+                f"[cyan]Showing the {len(results)} lowest-accuracy captions of {total_rows}; "
+                f"the JSON and Excel reports list all of them (run with --full to print every row)[/cyan]"
+            )
+
+    def save_mismatches(self, results: List[Dict], output_file: str = "matching.json", compress_json: bool = False):
+        excel_filename = str(Path(output_file).with_suffix(".xlsx"))
+        json_filename = output_file + ".gz" if compress_json else output_file
+
+        # JSON and Excel files are independent; building the report table runs on its worker too
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            json_written = executor.submit(_write_json_results, results, json_filename, compress_json)
+            excel_written = executor.submit(
+                lambda: _write_excel_report(_results_dataframe(results), excel_filename)
+            )
+        json_written.result()
+
         try:
-            # Save to Excel with formatting
-            with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Transcription Analysis', index=False)
-                
-                # Get the workbook and worksheet for formatting
-                workbook = writer.book
-                worksheet = writer.sheets['Transcription Analysis']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)  # Cap at 50 characters
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            excel_written.result()
             
             self.console.print()  # Add a blank line for spacing before
             self.console.print(
-                f"[green]✓ Results saved to [bold yellow]{output_file}[/bold yellow][/green]"
+                f"[green]✓ Results saved to [bold yellow]{json_filename}[/bold yellow][/green]"
             )
             self.console.print(
                 f"[green]✓ Excel report saved to [bold yellow]{excel_filename}[/bold yellow][/green]"
@@ -1074,20 +1584,20 @@ class VideoTranscriber:
             )
             self.console.print()
             self.console.print(
-                f"[green]✓ Results saved to [bold yellow]{output_file}[/bold yellow][/green]"
+                f"[green]✓ Results saved to [bold yellow]{json_filename}[/bold yellow][/green]"
             )
             self.console.print()
         except Exception as e:
             self.console.print(f"[red]Error saving Excel file: {str(e)}[/red]")
             self.console.print()
             self.console.print(
-                f"[green]✓ Results saved to [bold yellow]{output_file}[/bold yellow][/green]"
+                f"[green]✓ Results saved to [bold yellow]{json_filename}[/bold yellow][/green]"
             )
             self.console.print()
 
 
 def main():
-    transcriber = VideoTranscriber()
+    transcriber = VideoTranscriber(full_table="--full" in sys.argv[1:])
     
     # The script can handle any video URL with robust fallback:
     # - Dell support videos
@@ -1240,8 +1750,7 @@ def main():
             console.print("[yellow]   • The tool supports 100+ languages and any video format[/yellow]")
             
     finally:
-        import shutil
-        shutil.rmtree(transcriber.temp_dir)
+        transcriber.cleanup()
 
 
 if __name__ == "__main__":